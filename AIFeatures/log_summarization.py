@@ -4,7 +4,7 @@ This module exposes helpers that:
 - Build a system prompt that constrains the model to basic Markdown.
 - Build a user prompt from one or many `Log` objects, plus an optional
   custom instruction.
-- Call `send_prompt_to_openai` from `openai_prompter`.
+- Call `send_prompt_cached` from `openai_prompter`.
 - Return the summary as a plain string.
 
 Public API:
@@ -20,7 +20,7 @@ from __future__ import annotations
 from typing import Iterable, List, Optional
 
 from DataClasses.log import Log
-from .openai_prompter import content_summarization_enabled, send_prompt_to_openai
+from .openai_prompter import content_summarization_enabled, send_prompt_cached
 
 
 DEFAULT_SUMMARY_PROMPT = "Summarize the content of the log(s)."
@@ -125,7 +125,8 @@ def summarize_logs(logs: Iterable[Log], prompt: Optional[str] = None) -> str:
     system_prompt = _build_system_prompt()
     user_prompt = _build_user_prompt_for_logs(logs, prompt)
 
-    response = send_prompt_to_openai(
+    # Repeating a summary of unchanged logs reuses the earlier response.
+    response = send_prompt_cached(
         system=system_prompt,
         prompt=user_prompt,
         json_mode=False,
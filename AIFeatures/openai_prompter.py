@@ -1,5 +1,10 @@
 """Module for OpenAI prompter functionality."""
 
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+
 from openai import OpenAI
 from DataClasses.settings import user_settings
 
@@ -7,18 +12,32 @@ openai_client = None
 if user_settings.ai_settings.enabled and user_settings.ai_settings.api_key:
     openai_client = OpenAI(api_key=user_settings.ai_settings.api_key)
 
+# Responses to previous identical requests, most recently used last.
+_RESPONSE_CACHE_SIZE = 512
+_response_cache: "OrderedDict[bytes, object]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=1)
 def sentiment_analysis_enabled() -> bool:
     """Check if sentiment analysis feature is enabled."""
     return user_settings.ai_settings.sentiment_analysis and user_settings.ai_settings.enabled and openai_client is not None
 
+@functools.lru_cache(maxsize=1)
 def tag_recommendations_enabled() -> bool:
     """Check if tag recommendations feature is enabled."""
     return user_settings.ai_settings.tag_recommendations and user_settings.ai_settings.enabled and openai_client is not None
 
+@functools.lru_cache(maxsize=1)
 def content_summarization_enabled() -> bool:
     """Check if content summarization feature is enabled."""
     return user_settings.ai_settings.content_summarization and user_settings.ai_settings.enabled and openai_client is not None
 
+def clear_feature_flag_cache() -> None:
+    """Forget the cached `*_enabled()` results so they re-read settings."""
+    sentiment_analysis_enabled.cache_clear()
+    tag_recommendations_enabled.cache_clear()
+    content_summarization_enabled.cache_clear()
+
 def send_prompt_to_openai(system: str, prompt: str, model: str = "gpt-5.1", *, json_mode: bool | None = None) -> dict:
     """Send a prompt to OpenAI and return the response.
 
@@ -48,4 +67,32 @@ def send_prompt_to_openai(system: str, prompt: str, model: str = "gpt-5.1", *, j
         kwargs["response_format"] = {"type": "json_object"}
 
     response = openai_client.chat.completions.create(**kwargs)
-    return response
\ No newline at end of file
+    return response
+
+def send_prompt_cached(system: str, prompt: str, model: str = "gpt-5.1", *, json_mode: bool | None = None) -> dict:
+    """Like `send_prompt_to_openai`, but reuse the response to an identical request.
+
+    Requests are keyed by a digest of the model, mode and both prompts.
+    The prompts embed the log content, so editing a log naturally misses
+    the cache. Safe to call from several threads at once.
+    """
+
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (model, repr(json_mode), system, prompt):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    key = digest.digest()
+
+    with _response_cache_lock:
+        response = _response_cache.get(key)
+        if response is not None:
+            _response_cache.move_to_end(key)
+            return response
+
+    response = send_prompt_to_openai(system=system, prompt=prompt, model=model, json_mode=json_mode)
+
+    with _response_cache_lock:
+        _response_cache[key] = response
+        if len(_response_cache) > _RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+    return response
@@ -5,7 +5,7 @@ This module exposes a single main function
 
 - Builds a rich system prompt using the scoring instructions.
 - Sends the combined instructions and log body to OpenAI via
-  `send_prompt_to_openai`.
+  `send_prompt_cached`.
 - Expects the model to return a JSON object mapping emotion labels
   (e.g. "joy", "sadness") to numeric scores.
 - Persists the raw JSON analysis next to the log file, using the
@@ -21,7 +21,7 @@ from typing import Any, Dict
 from DataClasses.log import Log, LOGS_FOLDER
 from .openai_prompter import (
 	sentiment_analysis_enabled,
-	send_prompt_to_openai,
+	send_prompt_cached,
 )
 
 
@@ -203,7 +203,8 @@ def analyze_log_sentiment(log: Log) -> Dict[str, Any]:
 	system_prompt = _build_system_prompt()
 	user_prompt = _build_user_prompt(log)
 
-	response = send_prompt_to_openai(system=system_prompt, prompt=user_prompt)
+	# Re-analyzing an unchanged log reuses the earlier response.
+	response = send_prompt_cached(system=system_prompt, prompt=user_prompt)
 	result_json = _response_to_json(response)
 
 	analysis_path = _get_analysis_file_path(log)
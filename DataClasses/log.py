@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from typing import Optional
@@ -5,6 +6,7 @@ from DataClasses.tag import Tag as tag
 import json
 import os
 from Helpers import encryptor
+from Helpers.file_io import TEMP_SUFFIX, write_text_atomic
 
 
 LOGS_FOLDER = "logs"
@@ -15,6 +17,11 @@ def _datetime_from_iso(value: str) -> datetime:
     return datetime.fromisoformat(value)
 
 
+# Log files written off the GUI thread go through this, so disk latency
+# never blocks the UI. A single worker keeps successive saves of the same
+# log in order, whichever window made them.
+save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nbjournal-save")
+
 _MAX_ATTACHMENT_SIZE = 5 * 1024 * 1024 * 1024  # 5 GiB
 
 @dataclass
@@ -44,7 +51,25 @@ class Log:
     # visible.
     encrypted_payload: Optional[str] = None
 
-    
+    def __post_init__(self) -> None:
+        self.refresh_search_cache()
+
+    def refresh_search_cache(self) -> None:
+        """Recompute the lowercased text that log searching matches against.
+
+        Called on construction and on every save so the search bar never
+        has to lowercase fields per keystroke. Not part of the JSON.
+        """
+        # Also the key for alphabetical sorting.
+        self._name_lower = (self.name or "").lower()
+        # Title and description joined by a character a query can't
+        # contain, so one substring test checks both.
+        self._search_blob = f"{self._name_lower}\x00{(self.description or '').lower()}"
+        # Tag names for `tag:` queries, a hash lookup instead of a scan.
+        self._tags_lower = frozenset(t.name.lower() for t in self.tags)
+        # Body text for `body:` queries; lowering it per keystroke is the
+        # most expensive part of a body search.
+        self._body_lower = (self.body or "").lower()
 
     def add_revision(self) -> None:
         """Record a new revision timestamp and update last revised time."""
@@ -183,22 +208,40 @@ class Log:
 
     def save(self) -> None:
         """Persist the log to disk as JSON."""
-        if not os.path.exists(LOGS_FOLDER):
-            os.makedirs(LOGS_FOLDER)
+        self.write_serialized(self.serialize_for_save())
+
+    def serialize_for_save(self) -> str:
+        """Do the in-memory half of `save` and return the JSON to write.
 
+        Registers the log in the global list and refreshes its search
+        caches, so the rest of the app sees the new state immediately.
+        Pair with `write_serialized`, which is safe to run on another
+        thread since it only touches the returned string.
+        """
         global logs
-        if self not in logs:
+        if self.path not in logs_by_path:
             logs.append(self)
+            logs_by_path[self.path] = self
 
-        file_path = os.path.join(LOGS_FOLDER, self.path)
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(self.to_json_dict(), f, indent=4)
+        self.refresh_search_cache()
+        _bump_logs_generation()
+
+        return json.dumps(self.to_json_dict(), indent=4)
+
+    def write_serialized(self, payload: str) -> None:
+        """Write JSON produced by `serialize_for_save` to this log's file."""
+        os.makedirs(LOGS_FOLDER, exist_ok=True)
+
+        write_text_atomic(os.path.join(LOGS_FOLDER, self.path), payload)
 
     def delete(self) -> None:
         """Delete the log file from disk and remove from global logs list."""
         global logs
         if self in logs:
             logs.remove(self)
+        if logs_by_path.get(self.path) is self:
+            del logs_by_path[self.path]
+        _bump_logs_generation()
 
         file_path = os.path.join(LOGS_FOLDER, self.path)
         if os.path.exists(file_path):
@@ -250,6 +293,12 @@ class Log:
             os.remove(path)
 
 
+def _bump_logs_generation() -> None:
+    """Mark the global logs as changed; see `logs_generation`."""
+    global logs_generation
+    logs_generation += 1
+
+
 def load_logs() -> list[Log]:
     """Load existing logs from the logs folder."""
     if not os.path.exists(LOGS_FOLDER):
@@ -263,6 +312,8 @@ def load_logs() -> list[Log]:
 
     # Analysis files are stored alongside logs; skip them
     log_files = [f for f in log_files if not f.endswith("_analysis.json")]
+    # Left behind if the app died mid-save; the real file is still intact
+    log_files = [f for f in log_files if not f.endswith(TEMP_SUFFIX)]
 
     log_list: list[Log] = []
     for file in log_files:
@@ -276,4 +327,6 @@ def load_logs() -> list[Log]:
     return log_list
 
 
-logs: list[Log] = load_logs() # Global list of loaded logs
\ No newline at end of file
+logs: list[Log] = load_logs() # Global list of loaded logs
+logs_by_path: dict[str, Log] = {log.path: log for log in logs}  # Index of `logs` keyed by path
+logs_generation: int = 0  # Bumped whenever a log is saved or deleted, so views can skip no-op reloads
\ No newline at end of file
@@ -1,8 +1,9 @@
 from dataclasses import dataclass, asdict, field
+import functools
 import json
 import os
 from typing import Callable, Optional, List
-from PyQt6.QtGui import QFontDatabase
+from PyQt6.QtGui import QFont, QFontDatabase
 from UI.Homescreen import state as hs_state
 from UI.LogEditor import state as le_state
 
@@ -10,6 +11,23 @@ from PyQt6.QtWidgets import QMessageBox
 
 SETTINGS_FILE = "user_settings.json"
 
+
+@functools.lru_cache(maxsize=16)
+def _cached_font(family: str, size: int) -> QFont:
+    """Build the QFont for ``family`` at ``size`` once; see `_get_font`."""
+    return QFont(family, size)
+
+
+def _get_font(family: str, size: int) -> QFont:
+    """Return a QFont for ``family`` at ``size``.
+
+    The font is built once per family/size pair. Callers get their own
+    copy (cheap, since QFont is implicitly shared), so changing it doesn't
+    affect the cached one.
+    """
+    return QFont(_cached_font(family, size))
+
+
 @dataclass
 class ArtificialIntelligenceSettings:
     enabled: bool = field(
@@ -90,6 +108,10 @@ class LogViewerSettings:
                   "click": lambda: QMessageBox.information(None, "Available Fonts", "List of available fonts: " + ", ".join(QFontDatabase.families()))}
     )
 
+    def get_font(self) -> QFont:
+        """Return a QFont for the configured viewer family and size."""
+        return _get_font(self.font, self.font_size)
+
     def validate(self, errors: List[str]) -> None:
         if not isinstance(self.font_size, int) or self.font_size <= 0:
             errors.append(f"AppearanceSettings.font_size must be a positive integer. Got: {self.font_size!r}")
@@ -126,6 +148,10 @@ class LogEditorSettings:
         metadata={"tooltip": "The default view mode for the log editor. 0=Title+Description+Body, 1=Title+Body, 2=Body Only."}
     )
 
+    def get_font(self) -> QFont:
+        """Return a QFont for the configured editor family and size."""
+        return _get_font(self.font, self.font_size)
+
     def validate(self, errors: List[str]) -> None:
         if not isinstance(self.font_size, int) or self.font_size <= 0:
             errors.append(f"AppearanceSettings.font_size must be a positive integer. Got: {self.font_size!r}")
@@ -2,6 +2,8 @@ from dataclasses import dataclass, asdict
 from typing import Any
 import json
 import os
+import sys
+from Helpers.file_io import remove_if_exists, write_text_atomic
 
 
 TAGS_FOLDER = "tags"
@@ -19,7 +21,9 @@ class Tag:
         d = self.description.strip()
         if not n:
             raise ValueError("Tag.name cannot be empty")
-        object.__setattr__(self, "name", n)
+        # Interned: names are compared across logs, the tag index and the
+        # tag windows, and equal interned strings compare by identity.
+        object.__setattr__(self, "name", sys.intern(n))
         object.__setattr__(self, "description", d)
 
     def to_dict(self) -> dict[str, Any]:
@@ -32,15 +36,12 @@ class Tag:
 
         filename = f"{self.name}.json"
         filepath = os.path.join(TAGS_FOLDER, filename)
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(asdict(self), f, indent=4)
+        write_text_atomic(filepath, json.dumps(asdict(self), indent=4))
 
     def delete(self) -> None:
         """Delete the persisted JSON file for this tag, if present."""
         filename = f"{self.name}.json"
-        filepath = os.path.join(TAGS_FOLDER, filename)
-        if os.path.exists(filepath):
-            os.remove(filepath)
+        remove_if_exists(os.path.join(TAGS_FOLDER, filename))
 
 
 def load_tags() -> list[Tag]:
@@ -65,4 +66,5 @@ def load_tags() -> list[Tag]:
     return tags
 
 
-tags = load_tags()  # Global list of tags
\ No newline at end of file
+tags = load_tags()  # Global list of tags
+tags_by_name: dict[str, Tag] = {tag.name: tag for tag in tags}  # Index of `tags` keyed by name
\ No newline at end of file
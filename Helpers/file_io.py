@@ -0,0 +1,50 @@
+"""Small file-writing helpers shared by the data classes."""
+
+import os
+import tempfile
+
+
+# Suffix of the temporary files written next to their targets.
+TEMP_SUFFIX = ".tmp"
+
+# Mode a plain open() would give a new file. The umask can only be read
+# by setting it, so that is done once here, at import, rather than per
+# write where another thread could be creating files at the same time.
+_umask = os.umask(0)
+os.umask(_umask)
+_NEW_FILE_MODE = 0o666 & ~_umask
+del _umask
+
+
+def write_text_atomic(path: str, text: str) -> None:
+	"""Write ``text`` to ``path`` so readers see either the old or new file.
+
+	The text goes to a temporary file in the same folder, which then
+	replaces ``path`` in one step. A crash mid-write leaves the original
+	file intact instead of a truncated one. Each call gets its own
+	temporary file, so concurrent writers of one path can't clobber each
+	other's half-written data. The file keeps its existing permissions
+	(or gets the usual ones for a new file) rather than mkstemp's 0600.
+	"""
+	folder, name = os.path.split(path)
+	fd, temp_path = tempfile.mkstemp(dir=folder or None, prefix=name + ".", suffix=TEMP_SUFFIX)
+	try:
+		with os.fdopen(fd, "w", encoding="utf-8") as f:
+			f.write(text)
+		try:
+			mode = os.stat(path).st_mode & 0o7777
+		except FileNotFoundError:
+			mode = _NEW_FILE_MODE
+		os.chmod(temp_path, mode)
+		os.replace(temp_path, path)
+	except BaseException:
+		remove_if_exists(temp_path)
+		raise
+
+
+def remove_if_exists(path: str) -> None:
+	"""Delete ``path``, doing nothing if it is already gone."""
+	try:
+		os.remove(path)
+	except FileNotFoundError:
+		pass
@@ -1,51 +1,107 @@
-from PyQt6.QtCore import Qt, pyqtSignal, QObject, QThread
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QThread, QTimer
 from PyQt6.QtGui import QAction, QKeySequence, QShortcut
 import os
 from PyQt6.QtWidgets import (
-    QApplication,
     QMainWindow,
     QWidget,
     QVBoxLayout,
     QLabel,
     QPushButton,
-    QToolBar,
     QMessageBox,
     QHBoxLayout,
-    QMenu,
     QProgressDialog,
+    QInputDialog,
+    QLineEdit,
 )
 
-from UI.Settings.settings import SettingsWindow  # type: ignore[import]
-from UI.Homescreen.csv_loader import load_splash_texts
+from AIFeatures.log_summarization import summarize_logs
+from AIFeatures.openai_prompter import (
+    content_summarization_enabled,
+    sentiment_analysis_enabled,
+    tag_recommendations_enabled,
+)
+from AIFeatures.sentiment_analysis import analyze_log_sentiment
+from AIFeatures.tag_recommendations import recommend_tags_for_log
+from UI.Homescreen import state as homescreen_state
 from UI.Homescreen.logs_viewer import LogsViewer
+from UI.Homescreen.markdown_dialog import MarkdownDialog
+from UI.LogEditor import state as log_editor_state
+from UI.TagEditor import state as tag_editor_state
+from UI.TagManager import state as tag_manager_state
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import functools
+import itertools
 import random
+import threading
+import time
+import uuid
 import DataClasses.settings as settings
-from DataClasses.log import Log
+from DataClasses.log import Log, LOGS_FOLDER, logs_by_path, save_executor
+from DataClasses.tag import tags as global_tags
+
+
+# Dedicated generator for splash selection so it doesn't share the global
+# `random` module state with other threads.
+_splash_rng = random.Random()
+
+# Directory new logs are created in. This goes up three levels from this
+# file due to the project structure.
+LOGS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), LOGS_FOLDER)
+
+# Maximum number of OpenAI requests in flight during batch AI tasks.
+AI_BATCH_CONCURRENCY = 8
+
+# How long a batch worker blocks before re-checking for cancellation (s).
+_CANCEL_CHECK_INTERVAL = 0.1
+
+# Minimum time between progress updates sent from a batch worker (s).
+_PROGRESS_INTERVAL = 1 / 30
+
+
+def requires_current_log(action: str):
+    """Decorate a HomeScreen action that needs a selected log.
+
+    If no log is selected, the user is asked to "select a log to
+    `action`" and the action does not run.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self):
+            if self.current_log is None:
+                self._warn("No Log Selected", f"Please select a log to {action}.")
+                return None
+            return method(self)
+
+        return wrapper
+
+    return decorator
 
 
 class BackgroundWorker(QObject):
     """Generic worker object for running callables in a QThread.
 
-    Emits `finished` when the function completes successfully and `error`
-    with a string message if an exception is raised.
+    `func` is called with no arguments; callers pre-bind any arguments
+    with `functools.partial`. Emits `finished` when the function completes
+    successfully and `error` with a string message if an exception is raised.
     """
 
+    __slots__ = ("_func", "_uncancelable")
+
     finished = pyqtSignal()
     error = pyqtSignal(str)
     cancelled = pyqtSignal()
 
-    def __init__(self, func, *args, uncancelable: bool = False, **kwargs):
+    def __init__(self, func, uncancelable: bool = False):
         super().__init__()
         self._func = func
-        self._args = args
-        self._kwargs = kwargs
         self._uncancelable = uncancelable
 
     def run(self):
         try:
             # For uncancelable tasks we just always run the function; any
             # early return must be handled inside the function itself.
-            result = self._func(*self._args, **self._kwargs)
+            result = self._func()
             if not self._uncancelable and result == "cancelled":
                 self.cancelled.emit()
             else:
@@ -54,7 +110,11 @@ class BackgroundWorker(QObject):
             self.error.emit(str(exc))
 
 class HomeScreen(QMainWindow):
-    summary_ready = pyqtSignal(str, int)
+    # Emits an id into `_pending_summaries`; only the int crosses threads.
+    summary_ready = pyqtSignal(int)
+    # Background progress, emitted from worker threads (value / maximum).
+    progress_updated = pyqtSignal(int)
+    progress_maximum_changed = pyqtSignal(int)
 
     def __init__(self):
         super().__init__()
@@ -62,8 +122,7 @@ class HomeScreen(QMainWindow):
         # Register this instance as the globally-active homescreen
         # so other UI modules can reference it without importing
         # this file at module-import time.
-        from UI.Homescreen import state
-        state.active_homescreen = self
+        homescreen_state.active_homescreen = self
 
         self.setWindowTitle("NBJournal - Home")
         self.resize(800, 600)
@@ -85,13 +144,16 @@ class HomeScreen(QMainWindow):
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         title.setStyleSheet("font-size: 24px; font-weight: bold;")
 
+        # Splash texts are only read once at startup, so load them lazily.
+        from UI.Homescreen.csv_loader import load_splash_texts
+
         (all_splash_texts, no_asterisk_texts, asterisk_texts) = load_splash_texts()
         # Choose a splash text at random
         # If username is set, use any instance and replace * with username, otherwise, use non asterisked version
         if settings.user_settings.preferences.username != "default_user" and asterisk_texts:
-            splash_text = random.choice(all_splash_texts).replace("*", settings.user_settings.preferences.username)
+            splash_text = _splash_rng.choice(all_splash_texts).replace("*", settings.user_settings.preferences.username)
         elif no_asterisk_texts:
-            splash_text = random.choice(no_asterisk_texts)
+            splash_text = _splash_rng.choice(no_asterisk_texts)
         else:
             splash_text = "Welcome to NBJournal!"
         splash_label = QLabel(splash_text)
@@ -150,15 +212,39 @@ class HomeScreen(QMainWindow):
         # Placeholders for child windows
         self._settings_window = None
 
+        # Message boxes are created on first use per icon and then reused;
+        # see `_show_message`.
+        self._message_boxes: dict[QMessageBox.Icon, QMessageBox] = {}
+
+        # Coalesce bursts of reload requests (e.g. several saves in one
+        # event-loop spin) into a single rebuild of the logs viewer.
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(0)
+        self._reload_timer.timeout.connect(self.logs_viewer.reload_logs)
+
         # Track whether a background AI task is currently running
         self._background_task_running = False
         self._background_progress_dialog = None
         self._background_thread = None
         self._background_worker = None
-        self._background_cancelled = False
-
-        # Connect summary signal to UI handler (runs in main thread)
-        self.summary_ready.connect(self._show_summary_dialog)
+        # Set by the progress dialog's Cancel button; worker functions check
+        # it between units of work (and may `wait()` on it to pace work).
+        self._background_cancel_event = threading.Event()
+        # One pool of request threads shared by every batch AI task, so a
+        # batch doesn't pay to spin up (and tear down) its own threads.
+        self._ai_pool = ThreadPoolExecutor(max_workers=AI_BATCH_CONCURRENCY, thread_name_prefix="nbjournal-ai")
+
+        # Finished summaries keyed by id, handed from the worker thread to
+        # the UI thread via `summary_ready`.
+        self._pending_summaries: dict[int, tuple[str, int]] = {}
+        self._summary_ids = itertools.count()
+
+        # Connect summary signal to UI handler (runs in main thread). The
+        # signal is emitted from the background worker thread, so queue it.
+        self.summary_ready.connect(self._show_summary_dialog, Qt.ConnectionType.QueuedConnection)
+        self.progress_updated.connect(self._on_progress_updated, Qt.ConnectionType.QueuedConnection)
+        self.progress_maximum_changed.connect(self._on_progress_maximum_changed, Qt.ConnectionType.QueuedConnection)
 
         # Currently selected log exposed from the logs viewer
         self.current_log = self.logs_viewer.current_log
@@ -169,6 +255,9 @@ class HomeScreen(QMainWindow):
 
     def open_settings(self):
         if self._settings_window is None:
+            # Settings is opened rarely; defer importing it until needed.
+            from UI.Settings.settings import SettingsWindow  # type: ignore[import]
+
             self._settings_window = SettingsWindow(self)
         self._settings_window.show()
         self._settings_window.raise_()
@@ -190,11 +279,74 @@ class HomeScreen(QMainWindow):
 
     def _on_log_saved(self, _log):
         """Handle a log-saved event by reloading the logs viewer."""
-        self.logs_viewer.reload_logs()
+        self._request_reload()
+
+    def _request_reload(self) -> None:
+        """Schedule a logs viewer reload on the next event-loop iteration.
+
+        Repeated requests before the timer fires collapse into one reload.
+        """
+        self._reload_timer.start()
+
+    # ------------------------------------------------------------------
+    # Message box helpers
+    # ------------------------------------------------------------------
+
+    def _show_message(
+        self,
+        icon: QMessageBox.Icon,
+        title: str,
+        text: str,
+        buttons: QMessageBox.StandardButton = QMessageBox.StandardButton.Ok,
+    ) -> QMessageBox.StandardButton:
+        """Show a modal message using the shared box for `icon`.
+
+        Returns the standard button the user clicked, mirroring the static
+        `QMessageBox.information/warning/critical/question` helpers.
+        """
+        box = self._message_boxes.get(icon)
+        if box is None:
+            box = QMessageBox(icon, "", "", QMessageBox.StandardButton.Ok, self)
+            self._message_boxes[icon] = box
+        elif box.isVisible():
+            # The shared box is still open (a queued slot fired while it was
+            # in exec()); don't rewrite it under the user, use a new one.
+            extra = QMessageBox(icon, title, text, buttons, self)
+            extra.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+            return QMessageBox.StandardButton(extra.exec())
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setStandardButtons(buttons)
+        return QMessageBox.StandardButton(box.exec())
+
+    def _info(self, title: str, text: str) -> None:
+        self._show_message(QMessageBox.Icon.Information, title, text)
+
+    def _warn(self, title: str, text: str) -> None:
+        self._show_message(QMessageBox.Icon.Warning, title, text)
+
+    def _crit(self, title: str, text: str) -> None:
+        self._show_message(QMessageBox.Icon.Critical, title, text)
+
+    def _ask(self, title: str, text: str) -> QMessageBox.StandardButton:
+        """Ask a Yes/No question and return the clicked button."""
+        return self._show_message(
+            QMessageBox.Icon.Question,
+            title,
+            text,
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+        )
+
+    def _warn_feature_disabled(self, feature: str) -> None:
+        """Tell the user that the AI `feature` is switched off in settings."""
+        self._info(
+            f"{feature} Disabled",
+            f"The {feature.lower()} feature is disabled in settings, or AI features are disabled in general. "
+            "Please enable it to use this feature.",
+        )
 
     def show_credits(self):
-        QMessageBox.information(
-            self,
+        self._info(
             "Credits",
             "NBJournal\n\n"
             "Created by: Nate, Beto, and Emma\n"
@@ -318,8 +470,7 @@ class HomeScreen(QMainWindow):
         helpMenu = menuBar.addMenu("Help")
 
         self.searching_help_action = QAction("Searching Guide", self)
-        self.searching_help_action.triggered.connect(lambda: QMessageBox.information(
-            self,
+        self.searching_help_action.triggered.connect(lambda: self._info(
             "Search Help",
             "To search logs, type keywords into the search bar above the logs list.\n\n"
             "The search will filter logs by title or description in real-time as you type.\n\n"
@@ -339,8 +490,7 @@ class HomeScreen(QMainWindow):
         helpMenu.addAction(self.searching_help_action)
 
         self.info_action = QAction("About NBJournal", self)
-        self.info_action.triggered.connect(lambda: QMessageBox.information(
-            self,
+        self.info_action.triggered.connect(lambda: self._info(
             "About NBJournal",
             "NBJournal is a personal journaling application designed to help you organize and manage your logs effectively.\n\n"
             "Features include:\n"
@@ -354,8 +504,7 @@ class HomeScreen(QMainWindow):
         helpMenu.addAction(self.info_action)
 
         self.encryption_decryption_help_action = QAction("Encryption Help", self)
-        self.encryption_decryption_help_action.triggered.connect(lambda: QMessageBox.information(
-            self,
+        self.encryption_decryption_help_action.triggered.connect(lambda: self._info(
             "Encryption Help",
             "To encrypt a log, select it from the logs list and choose 'Encrypt Selected Log' from the 'Log' menu. "
             "You will be prompted to enter and confirm a password. Once encrypted, the log's content will be hidden "
@@ -366,6 +515,21 @@ class HomeScreen(QMainWindow):
         ))
         helpMenu.addAction(self.encryption_decryption_help_action)
 
+        # Actions that must not run while a background AI task is active.
+        # Toggled as a group by `_set_background_actions_enabled`.
+        self._bg_blocked_actions: list[QAction] = [
+            self.delete_log_action,
+            self.tag_editor_action,
+            self.edit_logs_action,
+            self.encrypt_selected_log_action,
+            self.decrypt_selected_log_action,
+        ]
+
+    def _set_background_actions_enabled(self, enabled: bool) -> None:
+        """Enable or disable every action blocked during background tasks."""
+        for action in self._bg_blocked_actions:
+            action.setEnabled(enabled)
+
     def _create_shortcuts(self):
         """Create keyboard shortcuts for common HomeScreen actions.
 
@@ -389,76 +553,62 @@ class HomeScreen(QMainWindow):
         # Open tag editor (Ctrl+T)
         QShortcut(QKeySequence("Ctrl+T"), self, activated=self._open_tag_editor)  
 
+    @requires_current_log("remove tags from")
     def _remove_all_tags_current_log(self) -> None:
         """Remove all tags from the currently selected log."""
-        if self.current_log is None:
-            QMessageBox.warning(self, "No Log Selected", "Please select a log to remove tags from.")
-            return
-        
         if not self.current_log.tags:
-            QMessageBox.information(self, "No Tags", "The selected log has no tags to remove.")
+            self._info("No Tags", "The selected log has no tags to remove.")
             return
         
-        confirm = QMessageBox.question(
-            self,
+        confirm = self._ask(
             "Confirm Remove Tags",
             "Are you sure you want to remove all tags from the selected log?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         if confirm == QMessageBox.StandardButton.Yes:
             self.current_log.tags.clear()
             self.current_log.save()
-            QMessageBox.information(self, "Tags Removed", "All tags have been removed from the selected log.")
-            self.logs_viewer.reload_logs()
+            self._info("Tags Removed", "All tags have been removed from the selected log.")
+            self._request_reload()
 
     def _remove_all_tags_all_shown_logs(self) -> None:
         """Remove all tags from all logs currently shown in the logs viewer."""
-        shown_logs = self.logs_viewer._filtered_logs
+        shown_logs = self.logs_viewer.filtered_logs
         if not shown_logs:
-            QMessageBox.information(self, "No Logs Shown", "There are no logs currently shown to remove tags from.")
+            self._info("No Logs Shown", "There are no logs currently shown to remove tags from.")
             return
         
         logs_with_tags = [log for log in shown_logs if log.tags]
         if not logs_with_tags:
-            QMessageBox.information(self, "No Tags", "None of the shown logs have tags to remove.")
+            self._info("No Tags", "None of the shown logs have tags to remove.")
             return
         
-        confirm = QMessageBox.question(
-            self,
+        confirm = self._ask(
             "Confirm Remove Tags",
             f"Are you sure you want to remove all tags from the {len(logs_with_tags)} shown logs that have tags?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         if confirm == QMessageBox.StandardButton.Yes:
             for log in logs_with_tags:
                 log.tags.clear()
                 log.save()
-            QMessageBox.information(self, "Tags Removed", "All tags have been removed from the shown logs.")
-            self.logs_viewer.reload_logs()
+            self._info("Tags Removed", "All tags have been removed from the shown logs.")
+            self._request_reload()
 
+    @requires_current_log("encrypt")
     def _encrypt_selected_log(self) -> None:
         """Encrypt the currently selected log."""
         # Block encryption while a log editor window is open.
-        from UI.LogEditor import state as log_editor_state  # type: ignore[import]
         if log_editor_state.active_log_editor is not None:
-            QMessageBox.information(
-                self,
+            self._info(
                 "Log Editor Open",
                 "Close the Log Editor before encrypting logs.",
             )
             return
 
-        if self.current_log is None:
-            QMessageBox.warning(self, "No Log Selected", "Please select a log to encrypt.")
-            return
-        
         if self.current_log.is_encrypted():
-            QMessageBox.information(self, "Log Already Encrypted", "The selected log is already encrypted.")
+            self._info("Log Already Encrypted", "The selected log is already encrypted.")
             return
         
         # Get password from user (basic text box)
-        from PyQt6.QtWidgets import QInputDialog, QLineEdit
-
         password, ok = QInputDialog.getText(self, "Encrypt Log", "Enter a password to encrypt the log:", QLineEdit.EchoMode.Password)
         if not ok or not password:
             return  # User cancelled or entered empty password
@@ -466,54 +616,47 @@ class HomeScreen(QMainWindow):
         # Ask for confirmation
         confirm_password, ok = QInputDialog.getText(self, "Confirm Password", "Re-enter the password to confirm:", QLineEdit.EchoMode.Password)
         if not ok or password != confirm_password:
-            QMessageBox.warning(self, "Password Mismatch", "The passwords do not match. Encryption cancelled.")
+            self._warn("Password Mismatch", "The passwords do not match. Encryption cancelled.")
             return
         
         try:
             self.current_log.encrypt_with_password(password)
-            QMessageBox.information(self, "Log Encrypted", "The selected log has been encrypted successfully.")
-            self.logs_viewer.reload_logs()
+            self._info("Log Encrypted", "The selected log has been encrypted successfully.")
+            self._request_reload()
         except Exception as e:
-            QMessageBox.critical(self, "Encryption Error", f"An error occurred while encrypting the log: {str(e)}")
+            self._crit("Encryption Error", f"An error occurred while encrypting the log: {str(e)}")
 
+    @requires_current_log("decrypt")
     def _decrypt_selected_log(self) -> None:
         """Decrypt the currently selected log."""
         # Block decryption while a log editor window is open.
-        from UI.LogEditor import state as log_editor_state  # type: ignore[import]
         if log_editor_state.active_log_editor is not None:
-            QMessageBox.information(
-                self,
+            self._info(
                 "Log Editor Open",
                 "Close the Log Editor before decrypting logs.",
             )
             return
 
-        if self.current_log is None:
-            QMessageBox.warning(self, "No Log Selected", "Please select a log to decrypt.")
-            return
-        
         if not self.current_log.is_encrypted():
-            QMessageBox.information(self, "Log Not Encrypted", "The selected log is not encrypted.")
+            self._info("Log Not Encrypted", "The selected log is not encrypted.")
             return
         
         # Get password from user (basic text box)
-        from PyQt6.QtWidgets import QInputDialog, QLineEdit
-
         password, ok = QInputDialog.getText(self, "Decrypt Log", "Enter the password to decrypt the log:", QLineEdit.EchoMode.Password)
         if not ok or not password:
             return  # User cancelled or entered empty password
         
         # Check if password works
         if not self.current_log.can_decrypt_with_password(password):
-            QMessageBox.warning(self, "Incorrect Password", "The password entered is incorrect. Decryption cancelled.")
+            self._warn("Incorrect Password", "The password entered is incorrect. Decryption cancelled.")
             return
 
         try:
             self.current_log.decrypt_with_password(password)
-            QMessageBox.information(self, "Log Decrypted", "The selected log has been decrypted successfully.")
-            self.logs_viewer.reload_logs()
+            self._info("Log Decrypted", "The selected log has been decrypted successfully.")
+            self._request_reload()
         except Exception as e:
-            QMessageBox.critical(self, "Decryption Error", f"An error occurred while decrypting the log: {str(e)}")
+            self._crit("Decryption Error", f"An error occurred while decrypting the log: {str(e)}")
 
     # ------------------------------------------------------------------
     # Background task helper
@@ -526,28 +669,23 @@ class HomeScreen(QMainWindow):
         or if another background task is already running.
         """
         # Check for open Log Editor
-        from UI.LogEditor import state as log_editor_state  # type: ignore[import]
         if log_editor_state.active_log_editor is not None:
-            QMessageBox.information(
-                self,
+            self._info(
                 "Log Editor Open",
                 "Close the Log Editor before running AI background tasks.",
             )
             return False
 
         # Check for open Tag Editor
-        from UI.TagEditor import state as tag_editor_state  # type: ignore[import]
         if tag_editor_state.active_tag_editor is not None:
-            QMessageBox.information(
-                self,
+            self._info(
                 "Tag Editor Open",
                 "Close the Tag Editor before running AI background tasks.",
             )
             return False
 
         if self._background_task_running:
-            QMessageBox.information(
-                self,
+            self._info(
                 "Background Task Running",
                 "Please wait for the current AI task to finish.",
             )
@@ -563,7 +701,7 @@ class HomeScreen(QMainWindow):
     def _on_background_task_error(self, message: str) -> None:
         """Slot called when the background worker reports an error."""
         self._finish_background_task()
-        QMessageBox.critical(self, "Background Task Error", message)
+        self._crit("Background Task Error", message)
 
     def _on_background_task_cancelled(self) -> None:
         """Slot called when the background worker reports a cancellation."""
@@ -577,7 +715,7 @@ class HomeScreen(QMainWindow):
         using `BackgroundWorker` so the UI remains responsive.
         """
         # Reset cancellation flag at start of each task
-        self._background_cancelled = False
+        self._background_cancel_event.clear()
         self._background_task_running = True
 
         dlg = QProgressDialog(label, "Cancel", 0, 0, self)
@@ -588,18 +726,10 @@ class HomeScreen(QMainWindow):
         dlg.setAutoReset(False)
         dlg.setValue(0)
 
-        # Wire the cancel button. For uncancelable tasks we keep the work
-        # running but notify the user that cancellation is not possible.
+        # Wire the cancel button. Uncancelable tasks don't get one at all,
+        # so there is nothing to connect.
         if uncancelable:
-            def _inform_uncancelable() -> None:
-                QMessageBox.information(
-                    self,
-                    "Task Cannot Be Cancelled",
-                    "This summarization task cannot be cancelled and will "
-                    "continue running to completion in the background.",
-                )
-
-            dlg.canceled.connect(_inform_uncancelable)
+            dlg.setCancelButton(None)
         else:
             dlg.canceled.connect(self._on_background_cancel_pressed)
 
@@ -608,25 +738,27 @@ class HomeScreen(QMainWindow):
         dlg.show()
 
         # While background task is running, disable actions that must not occur
-        self.delete_log_action.setEnabled(False)
-        self.tag_editor_action.setEnabled(False)
+        self._set_background_actions_enabled(False)
 
         if func is not None:
             # Create worker and thread for the long-running function
             self._background_thread = QThread(self)
-            self._background_worker = BackgroundWorker(func, uncancelable=uncancelable, **kwargs)
+            task = functools.partial(func, **kwargs) if kwargs else func
+            self._background_worker = BackgroundWorker(task, uncancelable=uncancelable)
             self._background_worker.moveToThread(self._background_thread)
 
-            # Wire signals
-            self._background_thread.started.connect(self._background_worker.run)
-            self._background_worker.finished.connect(self._on_background_task_finished)
-            self._background_worker.error.connect(self._on_background_task_error)
-            self._background_worker.cancelled.connect(self._on_background_task_cancelled)
-
-            # Ensure cleanup when done
-            self._background_worker.finished.connect(self._background_thread.quit)
-            self._background_worker.error.connect(self._background_thread.quit)
-            self._background_worker.cancelled.connect(self._background_thread.quit)
+            # Wire signals. `started` is emitted from the worker thread itself,
+            # so `run` can be invoked directly; worker -> UI slots always
+            # cross the thread boundary and are queued explicitly.
+            self._background_thread.started.connect(self._background_worker.run, Qt.ConnectionType.DirectConnection)
+            self._background_worker.finished.connect(self._on_background_task_finished, Qt.ConnectionType.QueuedConnection)
+            self._background_worker.error.connect(self._on_background_task_error, Qt.ConnectionType.QueuedConnection)
+            self._background_worker.cancelled.connect(self._on_background_task_cancelled, Qt.ConnectionType.QueuedConnection)
+
+            # Ensure cleanup when done (QThread.quit is thread-safe)
+            self._background_worker.finished.connect(self._background_thread.quit, Qt.ConnectionType.DirectConnection)
+            self._background_worker.error.connect(self._background_thread.quit, Qt.ConnectionType.DirectConnection)
+            self._background_worker.cancelled.connect(self._background_thread.quit, Qt.ConnectionType.DirectConnection)
             self._background_thread.finished.connect(self._background_worker.deleteLater)
             self._background_thread.finished.connect(self._clear_background_thread_refs)
 
@@ -642,8 +774,7 @@ class HomeScreen(QMainWindow):
             self._background_progress_dialog = None
 
         # Re-enable actions once background work is done
-        self.delete_log_action.setEnabled(True)
-        self.tag_editor_action.setEnabled(True)
+        self._set_background_actions_enabled(True)
 
     def _clear_background_thread_refs(self) -> None:
         """Clear references to the background thread/worker after completion."""
@@ -651,20 +782,70 @@ class HomeScreen(QMainWindow):
         self._background_worker = None
 
     def _on_background_cancel_pressed(self) -> None:
-        """Set a flag indicating the user has requested cancellation.
+        """Signal that the user has requested cancellation.
 
         Background worker functions should periodically check
-        `self._background_cancelled` (or be passed a reference to it)
-        and stop work early when it becomes True.
+        `self._background_cancel_event` (or be passed a reference to it)
+        and stop work early once it is set.
         """
-        self._background_cancelled = True
+        self._background_cancel_event.set()
+
+        # QProgressDialog hides itself on cancel; keep it up until requests
+        # that are already running have finished.
+        dlg = self._background_progress_dialog
+        if dlg is not None:
+            dlg.setLabelText("Cancelling…")
+            dlg.show()
+
+    def _on_progress_updated(self, value: int) -> None:
+        """Slot for `progress_updated`; runs on the UI thread."""
+        if self._background_progress_dialog is not None:
+            self._background_progress_dialog.setValue(value)
 
+    def _on_progress_maximum_changed(self, maximum: int) -> None:
+        """Slot for `progress_maximum_changed`; runs on the UI thread."""
+        if self._background_progress_dialog is not None:
+            self._background_progress_dialog.setMaximum(maximum)
+
+    def _run_batch_concurrently(self, func, items) -> str | None:
+        """Call `func(item)` for every item on the shared AI thread pool.
+
+        Progress is reported as calls complete. Once the cancel event is
+        set, calls that haven't started are dropped and "cancelled" is
+        returned as soon as the ones already running have finished.
+        """
+        self.progress_maximum_changed.emit(len(items))
+        self.progress_updated.emit(0)
+
+        completed = 0
+        last_emit = 0.0
+        pending = {self._ai_pool.submit(func, item) for item in items}
+        try:
+            while pending:
+                if self._background_cancel_event.is_set():
+                    return "cancelled"
+                done, pending = wait(pending, timeout=_CANCEL_CHECK_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+                completed += len(done)
+                # Throttle cross-thread updates; the final one always goes out.
+                now = time.monotonic()
+                if done and (not pending or now - last_emit >= _PROGRESS_INTERVAL):
+                    self.progress_updated.emit(completed)
+                    last_emit = now
+        finally:
+            # Drop queued calls, then wait out the in-flight ones. OpenAI
+            # requests can't be aborted, and a finishing call still changes
+            # logs and analysis files, so the task (and the locked UI) only
+            # ends once nothing is running.
+            for future in pending:
+                future.cancel()
+            wait(pending)
+        return None
+
+    @requires_current_log("view its information")
     def _show_log_info(self):
         """Show information about the currently selected log."""
-        if self.current_log is None:
-            QMessageBox.warning(self, "No Log Selected", "Please select a log to view its information.")
-            return
-
         info_text = (
             f"Name: {self.current_log.name}\n"
             f"Description: {self.current_log.description}\n"
@@ -675,31 +856,20 @@ class HomeScreen(QMainWindow):
             f"Tags: {', '.join(tag.name for tag in self.current_log.tags) if self.current_log.tags else 'None'}\n"
         )
 
-        QMessageBox.information(self, "Log Information", info_text)
+        self._info("Log Information", info_text)
 
     # === AI Features: Sentiment Analysis ===
 
+    @requires_current_log("analyze its sentiment")
     def _analyze_current_log_sentiment(self):
         """Start background task: analyze sentiment of the current log."""
-        from AIFeatures.openai_prompter import sentiment_analysis_enabled
         if not sentiment_analysis_enabled():
-            QMessageBox.information(
-                self,
-                "Sentiment Analysis Disabled",
-                "The sentiment analysis feature is disabled in settings, or AI features are disabled in general. "
-                "Please enable it to use this feature.",
-            )
-            return
-
-        if self.current_log is None:
-            QMessageBox.warning(self, "No Log Selected", "Please select a log to analyze its sentiment.")
+            self._warn_feature_disabled("Sentiment Analysis")
             return
 
         if not self._can_start_background_task():
             return
 
-        from AIFeatures.sentiment_analysis import analyze_log_sentiment
-
         self._start_background_task(
             title="Analyzing Sentiment",
             label="Analyzing sentiment of the current log...",
@@ -707,117 +877,110 @@ class HomeScreen(QMainWindow):
             log=self.current_log,
         )
 
-    def _batch_log_sentiment_analysis_worker(self):
+    def _batch_log_sentiment_analysis_worker(self, shown_logs: tuple[Log, ...]):
         """Worker function to analyze sentiment for all shown logs."""
-        from AIFeatures.sentiment_analysis import analyze_log_sentiment
-
-        self._background_progress_dialog.setValue(0)
-        self._background_progress_dialog.setMinimum(0)
-        self._background_progress_dialog.setMaximum(len(self.logs_viewer._filtered_logs))
-
-        shown_logs = self.logs_viewer._filtered_logs
-        for i, log in enumerate(shown_logs):
-            if self._background_cancelled:
-                return
-            analyze_log_sentiment(log)
-            self._background_progress_dialog.setValue(i + 1)
+        return self._run_batch_concurrently(analyze_log_sentiment, shown_logs)
 
     def _analyze_all_shown_logs_sentiment(self):
         """Start background task: analyze sentiment for all shown logs."""
-        from AIFeatures.openai_prompter import sentiment_analysis_enabled
         if not sentiment_analysis_enabled():
-            QMessageBox.information(
-                self,
-                "Sentiment Analysis Disabled",
-                "The sentiment analysis feature is disabled in settings, or AI features are disabled in general. "
-                "Please enable it to use this feature.",
-            )
+            self._warn_feature_disabled("Sentiment Analysis")
             return
 
         if not self._can_start_background_task():
             return
-        
-        from AIFeatures.sentiment_analysis import analyze_log_sentiment
 
         self._start_background_task(
             title="Analyzing Sentiment",
             label="Analyzing sentiment of all shown logs...",
             func=self._batch_log_sentiment_analysis_worker,
+            shown_logs=tuple(self.logs_viewer.filtered_logs),
         )
 
+    @requires_current_log("remove its sentiment data")
     def _remove_sentiment_data_current_log(self):
         """Remove sentiment data from current log."""
-        if self.current_log is None:
-            QMessageBox.warning(self, "No Log Selected", "Please select a log to remove its sentiment data.")
-            return
-
         self.current_log.delete_sentiment_analysis()
-        QMessageBox.information(
-            self,
+        self._info(
             "Sentiment Data Removed",
             "Sentiment analysis data has been removed from the current log.",
         )
 
     def _remove_sentiment_data_shown_logs(self):
-        """Start background task: remove sentiment data from all shown logs."""
-        shown_logs = self.logs_viewer._filtered_logs
-        for log in shown_logs:
+        """Remove sentiment data from all shown logs.
+
+        Just a local file delete per log, so it runs right here rather than
+        as a background task.
+        """
+        for log in self.logs_viewer.filtered_logs:
             log.delete_sentiment_analysis()
 
-        QMessageBox.information(
-            self,
+        self._info(
             "Sentiment Data Removed",
             "Sentiment analysis data has been removed from all shown logs.",
         )
 
     # === AI Features: Tag Recommendations ===
 
-    def _perform_tag_recommendation_worker(self, log: Log):
-        """Worker function to recommend tags for the current log."""
-        from AIFeatures.tag_recommendations import recommend_tags_for_log
+    def _perform_tag_recommendation_worker(self, log: Log, tag_by_name: dict | None = None, save: bool = True) -> bool:
+        """Worker function to recommend tags for the current log.
 
+        Batch callers pass a prebuilt `tag_by_name` lookup so it is built
+        once per batch rather than once per log, and `save=False` to write
+        the log themselves. Returns True if the log's tags were updated.
+        """
         try:
             res = recommend_tags_for_log(log)
         except Exception as e:
-            return
+            return False
 
-        from DataClasses.tag import tags
+        if tag_by_name is None:
+            tag_by_name = {t.name: t for t in global_tags}
 
         log.tags.clear()
         for tag_name in res.get("selected", []):
-            tag = next((t for t in tags if t.name == tag_name), None)
+            tag = tag_by_name.get(tag_name)
             if tag is not None:
                 log.tags.append(tag)
-        log.save()
+        if save:
+            log.save()
+        return True
 
-    def _batch_log_tag_recommendation_worker(self, ignore_already_tagged: bool = False):
+    def _batch_log_tag_recommendation_worker(self, shown_logs: tuple[Log, ...], ignore_already_tagged: bool = False):
         """Worker function to recommend tags for all shown logs."""
-        from AIFeatures.sentiment_analysis import analyze_log_sentiment
-
-        self._background_progress_dialog.setValue(0)
-        self._background_progress_dialog.setMinimum(0)
-        self._background_progress_dialog.setMaximum(len(self.logs_viewer._filtered_logs))
-
-        shown_logs = self.logs_viewer._filtered_logs
-        for i, log in enumerate(shown_logs):
-            if self._background_cancelled:
-                return
-            if ignore_already_tagged and log.tags:
-                self._background_progress_dialog.setValue(i + 1)
-                continue
-            self._perform_tag_recommendation_worker(log)
-            self._background_progress_dialog.setValue(i + 1)
+        if ignore_already_tagged:
+            shown_logs = [log for log in shown_logs if not log.tags]
+
+        tag_by_name = {t.name: t for t in global_tags}
+
+        # Updated logs are written in one pass at the end instead of after
+        # every request.
+        dirty_logs: list[Log] = []
+        dirty_lock = threading.Lock()
 
+        def recommend(log: Log) -> None:
+            if self._perform_tag_recommendation_worker(log, tag_by_name=tag_by_name, save=False):
+                with dirty_lock:
+                    dirty_logs.append(log)
+
+        try:
+            return self._run_batch_concurrently(recommend, shown_logs)
+        finally:
+            # Flush even on cancel/error so finished work isn't lost. No
+            # request is still running by now; see `_run_batch_concurrently`.
+            # Serialized here, one log at a time, since that updates the
+            # global logs index; only the writes go to the save worker,
+            # which keeps them in order with the log editor's.
+            payloads = [(log, log.serialize_for_save()) for log in dirty_logs]
+            writes = [save_executor.submit(log.write_serialized, payload) for log, payload in payloads]
+            for write in writes:
+                write.result()
+
+    @requires_current_log("recommend tags for")
     def _recommend_tags_current_log(self):
         """Start background task: recommend tags for the current log."""
-        from AIFeatures.openai_prompter import tag_recommendations_enabled
         if not tag_recommendations_enabled():
-            QMessageBox.information(
-                self,
-                "Tag Recommendations Disabled",
-                "The tag recommendations feature is disabled in settings, or AI features are disabled in general. "
-                "Please enable it to use this feature.",
-            )
+            self._warn_feature_disabled("Tag Recommendations")
             return
 
         if not self._can_start_background_task():
@@ -832,14 +995,8 @@ class HomeScreen(QMainWindow):
 
     def _recommend_tags_all_shown_logs(self):
         """Start background task: recommend tags for all shown logs."""
-        from AIFeatures.openai_prompter import tag_recommendations_enabled
         if not tag_recommendations_enabled():
-            QMessageBox.information(
-                self,
-                "Tag Recommendations Disabled",
-                "The tag recommendations feature is disabled in settings, or AI features are disabled in general. "
-                "Please enable it to use this feature.",
-            )
+            self._warn_feature_disabled("Tag Recommendations")
             return
         
         if not self._can_start_background_task():
@@ -849,19 +1006,14 @@ class HomeScreen(QMainWindow):
             title="Recommending Tags",
             label="Recommending tags for all shown logs...",
             func=self._batch_log_tag_recommendation_worker,
+            shown_logs=tuple(self.logs_viewer.filtered_logs),
             ignore_already_tagged=False,
         )
 
     def _recommend_tags_all_shown_logs_with_no_tags(self):
         """Start background task: recommend tags for shown logs with no tags."""
-        from AIFeatures.openai_prompter import tag_recommendations_enabled
         if not tag_recommendations_enabled():
-            QMessageBox.information(
-                self,
-                "Tag Recommendations Disabled",
-                "The tag recommendations feature is disabled in settings, or AI features are disabled in general. "
-                "Please enable it to use this feature.",
-            )
+            self._warn_feature_disabled("Tag Recommendations")
             return
 
         if not self._can_start_background_task():
@@ -871,17 +1023,17 @@ class HomeScreen(QMainWindow):
             title="Recommending Tags",
             label="Recommending tags for all shown logs...",
             func=self._batch_log_tag_recommendation_worker,
+            shown_logs=tuple(self.logs_viewer.filtered_logs),
             ignore_already_tagged=True,
         )
 
     def _summarize_log_worker(self, log: Log | list[Log], custom_prompt: str | None = None):
         """Worker function to summarize log(s).
 
-        Runs in a background thread; emits `summary_ready` with the
-        resulting markdown so the UI thread can display it.
+        Runs in a background thread; stores the resulting markdown in
+        `_pending_summaries` and emits its id via `summary_ready` so the
+        UI thread can display it.
         """
-        from AIFeatures.log_summarization import summarize_logs
-
         if isinstance(log, list):
             logs = log
         else:
@@ -890,32 +1042,24 @@ class HomeScreen(QMainWindow):
         result = summarize_logs(logs, prompt=custom_prompt)
 
         # Emit signal; the connected slot will show the dialog on the UI thread.
-        self.summary_ready.emit(result, len(logs))
+        summary_id = next(self._summary_ids)
+        self._pending_summaries[summary_id] = (result, len(logs))
+        self.summary_ready.emit(summary_id)
 
-    def _show_summary_dialog(self, markdown_text: str, log_count: int) -> None:
+    def _show_summary_dialog(self, summary_id: int) -> None:
         """Show the markdown summary result in a dialog (UI thread)."""
-        from UI.Homescreen.markdown_dialog import MarkdownDialog
-
+        markdown_text, log_count = self._pending_summaries.pop(summary_id)
         dialog_title = "Log Summary" if log_count == 1 else "Logs Summary"
         dlg = MarkdownDialog(dialog_title, markdown_text, parent=self)
         dlg.exec()
 
     # === AI Features: Content Summarization ===
 
+    @requires_current_log("summarize")
     def _summarize_current_log(self):
         """Start background task: summarize the current log content."""
-        from AIFeatures.openai_prompter import content_summarization_enabled
         if not content_summarization_enabled():
-            QMessageBox.information(
-                self,
-                "Content Summarization Disabled",
-                "The content summarization feature is disabled in settings, or AI features are disabled in general. "
-                "Please enable it to use this feature.",
-            )
-            return
-
-        if self.current_log is None:
-            QMessageBox.warning(self, "No Log Selected", "Please select a log to summarize.")
+            self._warn_feature_disabled("Content Summarization")
             return
 
         if not self._can_start_background_task():
@@ -939,22 +1083,17 @@ class HomeScreen(QMainWindow):
             title="Summarizing Logs",
             label="Summarizing all shown logs...",
             func=self._summarize_log_worker,
-            log=self.logs_viewer._filtered_logs,
+            log=list(self.logs_viewer.filtered_logs),
             custom_prompt=None,
             uncancelable=True,
         )
 
+    @requires_current_log("summarize")
     def _summarize_current_log_with_custom_prompt(self):
         """Start background task: summarize current log with custom prompt."""
-        if self.current_log is None:
-            QMessageBox.warning(self, "No Log Selected", "Please select a log to summarize.")
-            return
-
         if not self._can_start_background_task():
             return
 
-        from PyQt6.QtWidgets import QInputDialog
-
         prompt, ok = QInputDialog.getText(
             self,
             "Custom Summary Prompt",
@@ -977,8 +1116,6 @@ class HomeScreen(QMainWindow):
         if not self._can_start_background_task():
             return
 
-        from PyQt6.QtWidgets import QInputDialog
-
         prompt, ok = QInputDialog.getText(
             self,
             "Custom Summary Prompt",
@@ -991,7 +1128,7 @@ class HomeScreen(QMainWindow):
             title="Summarizing Logs",
             label="Summarizing all shown logs with your custom prompt...",
             func=self._summarize_log_worker,
-            log=self.logs_viewer._filtered_logs,
+            log=list(self.logs_viewer.filtered_logs),
             custom_prompt=prompt or None,
             uncancelable=True,
         )
@@ -1000,18 +1137,14 @@ class HomeScreen(QMainWindow):
         """Open the Tag Editor window."""
         # Block opening while a background task is running
         if self._background_task_running:
-            QMessageBox.information(
-                self,
+            self._info(
                 "Background Task Running",
                 "Wait for the current AI task to finish before opening the Tag Editor.",
             )
             return
         # Prevent opening the tag editor if a tag manager is already open.
-        from UI.TagManager import state as tag_manager_state  # type: ignore[import]
-
         if tag_manager_state.active_tag_manager is not None:
-            QMessageBox.information(
-                self,
+            self._info(
                 "Tag Manager Already Open",
                 "You already have a tag manager open. Please close it "
                 "before opening the tag editor.",
@@ -1021,10 +1154,8 @@ class HomeScreen(QMainWindow):
         from UI.TagEditor.tag_editor import TagEditorWindow  # type: ignore[import]
 
         # Do not allow multiple tag editor windows at once.
-        from UI.TagEditor import state as tag_editor_state
         if tag_editor_state.active_tag_editor is not None:
-            QMessageBox.information(
-                self,
+            self._info(
                 "Tag Editor Already Open",
                 "You already have a tag editor open. Please close it "
                 "before opening another.",
@@ -1037,41 +1168,31 @@ class HomeScreen(QMainWindow):
     def _new_log(self):
         """Create a new Log and open it in the Log Editor."""
         from UI.LogEditor.log_editor import LogEditorWindow  # type: ignore[import]
-        from DataClasses.log import Log, LOGS_FOLDER
-        import os
-        import uuid
 
         # Block opening while a background task is running
         if self._background_task_running:
-            QMessageBox.information(
-                self,
+            self._info(
                 "Background Task Running",
                 "Wait for the current AI task to finish before opening the Log Editor.",
             )
             return
 
         # Do not allow multiple log editor windows at once.
-        from UI.LogEditor import state as log_editor_state
         if log_editor_state.active_log_editor is not None:
-            QMessageBox.information(
-                self,
+            self._info(
                 "Log Editor Already Open",
                 "You already have a log editor open. Please close it "
                 "before opening another.",
             )
             return
 
-        # Randomly generate a new log path that does not overwrite
-        # an existing file in the `logs` directory.
-        # This weird path logic goes up three levels from this file due to the project structure.
-        logs_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), LOGS_FOLDER)
-        os.makedirs(logs_dir, exist_ok=True)
-
-        while True:
-            candidate_name = f"log_{uuid.uuid4().hex[:8]}.json"
-            candidate_path = os.path.join(logs_dir, candidate_name)
-            if not os.path.exists(candidate_path):
-                break
+        # Randomly generate a new log path. A full 128-bit uuid4 will
+        # practically never collide; the in-memory path index guards
+        # against it without touching the filesystem.
+        os.makedirs(LOGS_DIR, exist_ok=True)
+        candidate_name = f"log_{uuid.uuid4().hex}.json"
+        while candidate_name in logs_by_path:
+            candidate_name = f"log_{uuid.uuid4().hex}.json"
 
         new_log = Log(
             name="",
@@ -1083,38 +1204,31 @@ class HomeScreen(QMainWindow):
         log_editor = LogEditorWindow(new_log, parent=self)
         log_editor.show()
 
+    @requires_current_log("edit")
     def _edit_log(self):
         """Open the currently selected log in the Log Editor."""
         from UI.LogEditor.log_editor import LogEditorWindow  # type: ignore[import]
 
         # Block opening while a background task is running
         if self._background_task_running:
-            QMessageBox.information(
-                self,
+            self._info(
                 "Background Task Running",
                 "Wait for the current AI task to finish before opening the Log Editor.",
             )
             return
 
         # Do not allow multiple log editor windows at once.
-        from UI.LogEditor import state as log_editor_state
         if log_editor_state.active_log_editor is not None:
-            QMessageBox.information(
-                self,
+            self._info(
                 "Log Editor Already Open",
                 "You already have a log editor open. Please close it "
                 "before opening another.",
             )
             return
 
-        if self.current_log is None:
-            QMessageBox.warning(self, "No Log Selected", "Please select a log to edit.")
-            return
-
         # Disallow editing encrypted logs.
         if self.current_log.is_encrypted():
-            QMessageBox.information(
-                self,
+            self._info(
                 "Encrypted Log",
                 "Encrypted logs cannot be edited. Please decrypt the log first.",
             )
@@ -1123,41 +1237,34 @@ class HomeScreen(QMainWindow):
         log_editor = LogEditorWindow(self.current_log, parent=self)
         log_editor.show()
 
+    @requires_current_log("delete")
     def _delete_log(self):
         """Delete the currently selected log after user confirmation."""
         # Block delete while a background task is running
         if self._background_task_running:
-            QMessageBox.information(
-                self,
+            self._info(
                 "Background Task Running",
                 "Wait for the current AI task to finish before deleting logs.",
             )
             return
 
-        if self.current_log is None:
-            QMessageBox.warning(self, "No Log Selected", "Please select a log to delete.")
-            return
-
         # Disallow deleting encrypted logs.
         if self.current_log.is_encrypted():
-            QMessageBox.information(
-                self,
+            self._info(
                 "Encrypted Log",
                 "Encrypted logs cannot be deleted. Please decrypt the log first.",
             )
             return
 
-        confirm = QMessageBox.question(
-            self,
+        confirm = self._ask(
             "Confirm Delete",
             f"Are you sure you want to delete the log '{self.current_log.name}'?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
 
         if confirm == QMessageBox.StandardButton.Yes:
             try:
                 self.current_log.delete()
-                QMessageBox.information(self, "Log Deleted", "The log was deleted successfully.")
-                self.logs_viewer.reload_logs()
+                self._info("Log Deleted", "The log was deleted successfully.")
+                self._request_reload()
             except Exception as exc:
-                QMessageBox.critical(self, "Error", f"Failed to delete log:\n{exc}")
\ No newline at end of file
+                self._crit("Error", f"Failed to delete log:\n{exc}")
\ No newline at end of file
@@ -1,21 +1,87 @@
+import re
+from collections import OrderedDict
+from operator import attrgetter
 from typing import Optional
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QAbstractListModel, QModelIndex, QTimer
 from PyQt6.QtWidgets import (
 	QWidget,
 	QVBoxLayout,
 	QHBoxLayout,
-	QListWidget,
-	QListWidgetItem,
+	QListView,
 	QLineEdit,
 	QLabel,
 	QTextBrowser,
 )
-from PyQt6.QtGui import QFont
+from PyQt6.QtGui import QTextDocument
 
+import DataClasses.log as log_module
 from DataClasses.log import Log, logs
 from DataClasses.settings import user_settings
 
+# Relative cost of each search predicate, by key (None = plain word).
+# Cheap tests run first so a log is rejected before any body scan.
+# Unknown keys never match, so they sort ahead of everything.
+_PREDICATE_COST = {"tag": 1, None: 2, "body": 3}
+
+# Sort directives that may appear among the search tokens.
+_SORT_ORDERS = {
+	"sort:alphabetical": "alphabetical",
+	"sort:created": "created",
+	"sort:modified": "modified",
+}
+_SORT_REVERSED = {
+	"sort:reverse": True,
+	"sort:desc": True,
+	"sort:asc": False,
+	"sort:forward": False,
+}
+
+# Field matchers for key:value search terms, keyed by the lowercased key.
+_KEY_HANDLERS = {
+	"tag": lambda log, value: value in log._tags_lower,
+	"body": lambda log, value: value in log._body_lower,
+}
+
+# One search token: a run of non-space characters in which quoted
+# sections (closed or running to the end) may contain spaces.
+_TOKEN_RE = re.compile(r'(?:"[^"]*"?|[^ "])+')
+
+# Number of rendered log previews kept around for quick re-selection.
+_PREVIEW_CACHE_SIZE = 32
+
+class LogsModel(QAbstractListModel):
+	"""Read-only list model over a list of `Log` objects.
+
+	Rows are produced on demand from the backing list, so no per-row
+	item objects are allocated no matter how many logs there are.
+	"""
+
+	def __init__(self, logs: list[Log], parent: Optional[QWidget] = None) -> None:
+		super().__init__(parent)
+		self._logs = logs
+
+	def set_logs(self, logs: list[Log]) -> None:
+		"""Replace the backing list and tell attached views to refresh."""
+		self.beginResetModel()
+		self._logs = logs
+		self.endResetModel()
+
+	def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+		if parent.isValid():
+			return 0
+		return len(self._logs)
+
+	def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+		if not index.isValid():
+			return None
+		log = self._logs[index.row()]
+		if role == Qt.ItemDataRole.DisplayRole:
+			return log.name
+		if role == Qt.ItemDataRole.UserRole:
+			return log
+		return None
+
 class LogsViewer(QWidget):
 	"""Widget that lists logs and shows the selected one side‑by‑side.
 
@@ -30,8 +96,15 @@ class LogsViewer(QWidget):
 	def __init__(self, parent: Optional[QWidget] = None) -> None:
 		super().__init__(parent)
 		self._logs: list[Log] = logs
-		self._filtered_logs: list[Log] = list(self._logs)
+		# `logs_generation` the list was last sorted and filtered at.
+		self._logs_generation = log_module.logs_generation
+		self._sort_logs()
+		self._filtered_logs: list[Log] = self._logs_by_modified
 		self._current_log: Optional[Log] = None
+		# Rendered preview documents keyed by log path, each stored with the
+		# body it was rendered from; most recently shown last.
+		self._preview_docs: "OrderedDict[str, tuple[str, QTextDocument]]" = OrderedDict()
+		self._blank_preview_doc = QTextDocument(self)
 
 		self._init_ui()
 		self._populate_list()
@@ -41,6 +114,15 @@ class LogsViewer(QWidget):
 		"""Return the currently selected `Log`, if any."""
 		return self._current_log
 
+	@property
+	def filtered_logs(self) -> list[Log]:
+		"""Return the logs currently shown in the list, in display order.
+
+		The list is recomputed only when the search text changes or the
+		logs are reloaded, so repeated reads are free.
+		"""
+		return self._filtered_logs
+
 	def _init_ui(self) -> None:
 		root_layout = QHBoxLayout()
 		root_layout.setContentsMargins(0, 0, 0, 0)
@@ -52,15 +134,26 @@ class LogsViewer(QWidget):
 		self.search_bar = QLineEdit()
 		self.search_bar.textChanged.connect(self._on_search_text_changed)
 
-		self.list_widget = QListWidget()
-		self.list_widget.setSelectionMode(
-			QListWidget.SelectionMode.SingleSelection
+		# Refilter once typing pauses rather than on every keystroke.
+		self._search_timer = QTimer(self)
+		self._search_timer.setSingleShot(True)
+		self._search_timer.setInterval(120)
+		self._search_timer.timeout.connect(self._populate_list)
+
+		self._model = LogsModel(self._filtered_logs, self)
+		self.list_view = QListView()
+		self.list_view.setSelectionMode(
+			QListView.SelectionMode.SingleSelection
 		)
-		self.list_widget.currentItemChanged.connect(self._on_list_selection_changed)
+		# Every row is a single line of text, so let the view skip
+		# measuring each row individually.
+		self.list_view.setUniformItemSizes(True)
+		self.list_view.setModel(self._model)
+		self.list_view.selectionModel().currentChanged.connect(self._on_list_selection_changed)
 
 		list_layout.addWidget(list_label)
 		list_layout.addWidget(self.search_bar)
-		list_layout.addWidget(self.list_widget, 1)
+		list_layout.addWidget(self.list_view, 1)
 
 		# Right: basic preview of selected log
 		preview_layout = QVBoxLayout()
@@ -74,9 +167,17 @@ class LogsViewer(QWidget):
 
 		self.preview_body = QTextBrowser()
 		# Set font according to app settings
-		self.preview_body.setFont(QFont(user_settings.log_viewer.font, user_settings.log_viewer.font_size))
+		self.preview_body.setFont(user_settings.log_viewer.get_font())
 		self.preview_body.setOpenExternalLinks(True)
 
+		# Rendering the markdown body is the expensive part of the preview,
+		# so wait for the selection to settle (e.g. while arrowing through
+		# the list) before doing it.
+		self._preview_timer = QTimer(self)
+		self._preview_timer.setSingleShot(True)
+		self._preview_timer.setInterval(150)
+		self._preview_timer.timeout.connect(self._render_preview_body)
+
 		preview_layout.addWidget(self.preview_title)
 		preview_layout.addWidget(self.preview_description)
 		preview_layout.addWidget(self.preview_body, 1)
@@ -87,48 +188,76 @@ class LogsViewer(QWidget):
 		self.setLayout(root_layout)
 
 	def _populate_list(self) -> None:
-		self.list_widget.clear()
-
 		# Ensure filters are applied
 		self._apply_search_filter(self.search_bar.text())
 
-		for log in self._filtered_logs:
-			item = QListWidgetItem(log.name)
-			# store the Log instance on the item for easy lookup
-			item.setData(Qt.ItemDataRole.UserRole, log)
-			self.list_widget.addItem(item)
+		# Resetting the model clears the current index without emitting
+		# `currentChanged`, so the selection is re-announced below.
+		previous = self._current_log
+		self._model.set_logs(self._filtered_logs)
 
 		if self._filtered_logs:
-			self.list_widget.setCurrentRow(0)
+			# Keep the selected log selected if it survived the filter, so
+			# typing in the search bar doesn't make the selection jump.
+			row = next((i for i, log in enumerate(self._filtered_logs) if log is previous), 0)
+			index = self._model.index(row)
+			self.list_view.setCurrentIndex(index)
+			self.list_view.scrollTo(index)
+		else:
+			self._on_list_selection_changed(QModelIndex(), QModelIndex())
 
 	def reload_logs(self) -> None:
 		"""Reload the logs from the shared `logs` collection and refresh UI."""
+		# Nothing was saved or deleted since the last reload (e.g. a dialog
+		# was closed without changes), so the list is already current.
+		if self._logs is log_module.logs and self._logs_generation == log_module.logs_generation:
+			return
 		# Re-bind to the global `logs` list in case it changed elsewhere.
-		from DataClasses.log import logs as global_logs  # local import to avoid cycles
-		self._logs = global_logs
-		self._filtered_logs = self._logs
-		self._apply_search_filter()
+		self._logs = log_module.logs
+		self._logs_generation = log_module.logs_generation
+		log_module.logs_by_path.clear()
+		log_module.logs_by_path.update((log.path, log) for log in self._logs)
+		self._sort_logs()
+		# This repopulates with the current search text, so a pending
+		# search refresh would be redundant.
+		self._search_timer.stop()
 		self._populate_list()
+		# The selected log may have been edited in place, which reselecting
+		# the same object doesn't pick up.
+		self._update_preview()
+
+	def _sort_logs(self) -> None:
+		"""Rebuild `_logs_by_modified`, the logs in the default (newest first) order.
+
+		Filtering walks this list, so results come out already sorted for
+		the default order. Sorting happens once per reload, not per search.
+		"""
+		self._logs_by_modified = sorted(self._logs, key=attrgetter("revised_at"), reverse=True)
 
 	def _on_list_selection_changed(
 		self,
-		current: Optional[QListWidgetItem],
-		previous: Optional[QListWidgetItem],  # noqa: ARG002 - kept for signal
+		current: QModelIndex,
+		previous: QModelIndex,  # noqa: ARG002 - kept for signal
 	) -> None:
 		log: Optional[Log]
-		if current is None:
+		if not current.isValid():
 			log = None
 		else:
 			log = current.data(Qt.ItemDataRole.UserRole)
 
+		# Re-selecting the same log (e.g. after a search update resets the
+		# model) is not a transition; the preview is already showing it.
+		if log is self._current_log:
+			return
 		self._current_log = log
 		self._update_preview()
 		self.selected_log_changed.emit(log)
 
 	def _on_search_text_changed(self, text: str) -> None:
 		"""Update the filtered list of logs when the search text changes."""
-		# Populate list already applies the search filter
-		self._populate_list()
+		# Populate list already applies the search filter; restarting the
+		# timer collapses a burst of keystrokes into one pass.
+		self._search_timer.start()
 
 	def _apply_search_filter(self, query: str = "") -> None:
 		"""Filter and sort logs based on the provided query.
@@ -142,100 +271,96 @@ class LogsViewer(QWidget):
 		reversed_sort = True
 
 		if not normalized:
-			self._filtered_logs = list(self._logs)
-		else:
-			# Split query into list of queries
-			# Queries are either just words to match the title/description
-			# Or key:value pairs to match specific fields, e.g. "tag:work"
-			# key:value pairs can be written as key:"value with quotes to include spaces"
-			# Search terms that start with ! are negated (e.g., !tag:personal)
-
-			queries = []
-			current = ""
-			in_quotes = False
-			for char in normalized:
-				if char == '"':
-					in_quotes = not in_quotes
-				elif char == " " and not in_quotes:
-					if current:
-						queries.append(current)
-						current = ""
+			# No query means no filter and the default sort, which is
+			# exactly `_logs_by_modified`. Share it rather than copying;
+			# `_sort_logs` rebinds that list instead of mutating it.
+			self._filtered_logs = self._logs_by_modified
+			return
+
+		# Split query into list of queries
+		# Queries are either just words to match the title/description
+		# Or key:value pairs to match specific fields, e.g. "tag:work"
+		# key:value pairs can be written as key:"value with quotes to include spaces"
+		# Search terms that start with ! are negated (e.g., !tag:personal)
+
+		# Quote characters only group words; they are not part of the
+		# token, and a token that was only quotes is dropped.
+		queries = [
+			token
+			for token in (match.replace('"', "") for match in _TOKEN_RE.findall(normalized))
+			if token
+		]
+
+		# Compile the queries once into (key, value, negate) predicates;
+		# plain words get key None. Only `matches` runs per log. Sorting
+		# directives are picked out in the same pass.
+		predicates: list[tuple[Optional[str], str, bool]] = []
+		for q in queries:
+			if q in _SORT_ORDERS:
+				sort = _SORT_ORDERS[q]
+				continue
+			if q in _SORT_REVERSED:
+				reversed_sort = _SORT_REVERSED[q]
+				continue
+
+			negate = q.startswith("!")
+			if negate:
+				q = q[1:]
+			if ":" in q:
+				key, value = q.split(":", 1)
+				predicates.append((key, value.strip('"'), negate))
+			else:
+				predicates.append((None, q, negate))
+		predicates.sort(key=lambda p: _PREDICATE_COST.get(p[0], 0))
+
+		# Filtering
+		def matches(log: Log) -> bool:
+			for key, value, negate in predicates:
+				if key is None:
+					# simple word match in title or description
+					hit = value in log._search_blob
 				else:
-					current += char
-			if current:
-				queries.append(current)
-
-			# Check for sorting directive
-			if "sort:alphabetical" in queries:
-				sort = "alphabetical"
-				queries.remove("sort:alphabetical")
-			elif "sort:created" in queries:
-				sort = "created"
-				queries.remove("sort:created")
-			elif "sort:modified" in queries:
-				sort = "modified"
-				queries.remove("sort:modified")
-
-			# Reversed sort
-			if "sort:reverse" in queries:
-				reversed_sort = True
-				queries.remove("sort:reverse")
-			elif "sort:desc" in queries:
-				reversed_sort = True
-				queries.remove("sort:desc")
-
-			# Forward sort
-			if "sort:asc" in queries:
-				reversed_sort = False
-				queries.remove("sort:asc")
-			elif "sort:forward" in queries:
-				reversed_sort = False
-				queries.remove("sort:forward")
-
-			# Filtering
-			def matches(log: Log) -> bool:
-				for q in queries:
-					negate = False
-					if q.startswith("!"):
-						negate = True
-						q = q[1:]
-					
-					if ":" in q:
-						# key:value pair
-						key, value = q.split(":", 1)
-						
-						value = value.strip('"')
-						if key == "tag":
-							if not any(t.name.lower() == value for t in log.tags) and not negate:
-								return False
-							elif any(t.name.lower() == value for t in log.tags) and negate:
-								return False
-						if key == "body":
-							if value not in (log.body or "").lower() and not negate:
-								return False
-							elif value in (log.body or "").lower() and negate:
-								return False
-						else:
-							# Unknown key; ignore
-							return False
-					else:
-						# simple word match in title or description
-						if q not in (log.name or "").lower() and q not in (log.description or "").lower() and not negate:
-							return False
-						elif (q in (log.name or "").lower() or q in (log.description or "").lower()) and negate:
-							return False
-				return True
-			
-			# Apply filtering
-			self._filtered_logs = [log for log in self._logs if matches(log)]
-
-		# Default sort: alphabetical by title; customize this as needed.
+					handler = _KEY_HANDLERS.get(key)
+					if handler is None:
+						# Unknown key; nothing matches
+						return False
+					hit = handler(log, value)
+				if hit == negate:
+					return False
+			return True
+
+		# Apply filtering. A lone term is by far the most common query, so it
+		# is tested inline instead of through the general loop.
+		if not predicates:
+			# Only sort directives; every log matches.
+			self._filtered_logs = list(self._logs_by_modified)
+		elif len(predicates) == 1:
+			key, value, negate = predicates[0]
+			if key is None:
+				self._filtered_logs = [
+					log for log in self._logs_by_modified if (value in log._search_blob) != negate
+				]
+			elif key in _KEY_HANDLERS:
+				handler = _KEY_HANDLERS[key]
+				self._filtered_logs = [
+					log for log in self._logs_by_modified if handler(log, value) != negate
+				]
+			else:
+				self._filtered_logs = []
+		else:
+			self._filtered_logs = [log for log in self._logs_by_modified if matches(log)]
+
+		# The filtered list is already newest-first, so the default sort
+		# needs no work and oldest-first is just a reversal.
+		if sort == "modified":
+			if not reversed_sort:
+				self._filtered_logs.reverse()
+			return
+
 		if sort == "alphabetical":
-			self._filtered_logs.sort(key=lambda log: log.name.lower() if log.name else "")
+			self._filtered_logs.sort(key=attrgetter("_name_lower"))
 		elif sort == "created":
-			self._filtered_logs.sort(key=lambda log: log.created_at or 0)
-		elif sort == "modified":
-			self._filtered_logs.sort(key=lambda log: log.revised_at or 0)
+			self._filtered_logs.sort(key=attrgetter("created_at"))
 
 		if reversed_sort:
 			self._filtered_logs.reverse()
@@ -245,14 +370,44 @@ class LogsViewer(QWidget):
 		if log is None:
 			self.preview_title.setText("")
 			self.preview_description.setText("")
-			self.preview_body.setHtml("")
+			self._preview_timer.stop()
+			# Swap documents rather than clearing, which would wipe a cached one.
+			self.preview_body.setDocument(self._blank_preview_doc)
 			return
 
 		self.preview_title.setText(log.name)
 		self.preview_description.setText(log.description)
-		# Treat the log body as markdown-like text rendered via basic HTML.
-		# QTextBrowser understands a subset of HTML; if the body already
-		# contains markdown, it can be pre-converted to HTML before
-		# assignment. For now, we assume `log.body` holds HTML/markdown-
-		# compatible content.
-		self.preview_body.setMarkdown(log.body)
\ No newline at end of file
+		if not log.body:
+			# Nothing to parse; show the blank document straight away.
+			self._preview_timer.stop()
+			self.preview_body.setDocument(self._blank_preview_doc)
+			return
+		self._preview_timer.start()
+
+	def _render_preview_body(self) -> None:
+		"""Render the body of whichever log is selected once the timer fires."""
+		log = self._current_log
+		if log is None:
+			return
+		# Reuse the document rendered last time if the body hasn't changed
+		# since; markdown parsing is the bulk of the preview cost.
+		cached = self._preview_docs.get(log.path)
+		if cached is not None and cached[0] == log.body:
+			doc = cached[1]
+			self._preview_docs.move_to_end(log.path)
+		else:
+			doc = QTextDocument(self)
+			doc.setMarkdown(log.body)
+			self._preview_docs[log.path] = (log.body, doc)
+			self._preview_docs.move_to_end(log.path)
+
+		# The widget font may have changed in settings since `doc` was built.
+		doc.setDefaultFont(self.preview_body.font())
+		if self.preview_body.document() is not doc:
+			self.preview_body.setDocument(doc)
+
+		if cached is not None and cached[1] is not doc:
+			cached[1].deleteLater()
+		while len(self._preview_docs) > _PREVIEW_CACHE_SIZE:
+			_, (_, stale_doc) = self._preview_docs.popitem(last=False)
+			stale_doc.deleteLater()
\ No newline at end of file
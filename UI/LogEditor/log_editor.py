@@ -1,28 +1,151 @@
 import sys
 import os
+import re
+from concurrent.futures import Future
+from datetime import datetime
+from functools import partial
 
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
-	QApplication,
 	QMainWindow,
 	QWidget,
 	QVBoxLayout,
 	QHBoxLayout,
 	QLabel,
 	QLineEdit,
-	QTextEdit,
+	QPlainTextEdit,
 	QPushButton,
-	QToolBar,
 	QMessageBox,
 	QFileDialog
 )
-from PyQt6.QtGui import QAction, QFont
+from PyQt6.QtGui import QAction, QKeySequence, QShortcut
 
-from DataClasses.log import Log
-from UI.Homescreen.homescreen import HomeScreen
+from DataClasses.log import Log, save_executor
 from UI.LogEditor import state as log_editor_state
+from UI.TagEditor import state as tag_editor_state
+from UI.TagEditor.tag_editor import TagEditorWindow
+from UI.TagManager import state as tag_manager_state
+from UI.TagManager.tag_manager import TagManagerWindow
 from DataClasses.settings import user_settings
 
+# Menu actions that insert fixed markdown, keyed by label: (shortcut,
+# text, how far to move the cursor back from the end of the text, if at
+# all).
+_INSERT_ACTIONS = {
+	"Heading 1": ("Ctrl+1", "# ", None),
+	"Heading 2": ("Ctrl+2", "## ", None),
+	"Heading 3": ("Ctrl+3", "### ", None),
+	"Bold": ("Ctrl+B", "****", 2),
+	"Italic": ("Ctrl+I", "**", 1),
+	"Bold + Italic": ("Ctrl+Shift+B", "******", 3),
+	"Strikethrough": ("Ctrl+T", "~~~~", 2),
+	"Inline Code": ("Ctrl+`", "``", 1),
+	"Code Block": ("Ctrl+Shift+C", "```\n\n```", 4),
+	"Horizontal Rule": ("Ctrl+R", "\n---\n", None),
+	"Insert Link": ("Ctrl+K", "[]()", 3),
+}
+
+# List item prefixes, matched against a line with its indentation removed.
+_RE_TASK = re.compile(r"^- \[[ xX]\] \s*")
+
+
+def _parse_numbered_prefix(text: str) -> int | None:
+	"""Return N if ``text`` starts with a numbered item like "N. ", else None.
+
+	A plain character scan; this runs for every line of the list above the
+	cursor, where it is noticeably cheaper than a regex match.
+	"""
+	i = 0
+	n = len(text)
+	while i < n and "0" <= text[i] <= "9":
+		i += 1
+	if i == 0 or i + 1 >= n or text[i] != "." or not text[i + 1].isspace():
+		return None
+	return int(text[:i])
+
+
+# Text for the Help menu dialogs.
+HELP_MARKDOWN_GUIDE = """
+MARKDOWN QUICK GUIDE (FOR JOURNAL ENTRIES)
+=========================================
+
+BASIC FORMATTING
+----------------
+Bold:        **text**
+Italic:      *text*
+Bold+Italic: ***text***
+Strikethrough: ~~text~~
+
+HEADINGS
+--------
+# Heading 1
+## Heading 2
+### Heading 3
+
+LISTS
+-----
+Bullet list:
+- item one
+- item two
+
+Numbered list:
+1. first item
+2. second item
+
+TASK LISTS (CHECKBOXES)
+-----------------------
+- [ ] thing to do
+- [x] finished thing
+
+HORIZONTAL LINE
+---------------
+Use three dashes:
+---
+
+CODE
+----
+Inline code example:
+Use `print("hi")` format for inline code.
+
+Code block example (indent by four spaces):
+    print("Hello journal!")
+
+LINKS (WEB, FILES, FOLDERS)
+---------------------------
+Web link example:
+[Example](https://example.com)
+
+Link to a file (opens in your system's default app):
+[My PDF](file:///C:/Users/you/Documents/notes.pdf)
+[Notes](file:///home/you/Documents/notes.txt)
+
+Link to a folder (opens file explorer):
+[Journal Folder](file:///C:/Users/you/Documents/Journal/)
+[Projects](file:///home/you/Projects/)
+
+TIPS FOR FILE LINKS
+-------------------
+- Use: file:/// + full absolute path
+- Windows paths: C:/Users/you/Documents/...
+- Spaces in paths usually work fine
+- Make sure the file or folder actually exists
+
+GOOD HABITS
+-----------
+- Prefer absolute paths
+- Avoid moving files after linking them
+- Double-check path spelling if something won't open
+"""
+
+HELP_TAGGING_GUIDE = (
+	"Tags are labels you can assign to your journal entries to help organize and categorize them.\n\n"
+	"To manage your tags, use the Tag Manager from the Tag menu. You can add new tags or remove existing ones there.\n\n"
+	"To create, edit, or delete tags in detail, use the Tag Editor also found in the Tag menu.\n\n"
+	"Once you have tags created, you can assign them to your journal entries while editing a log.\n\n"
+	"Tags help you filter and find related entries easily in the Homescreen view.\n\n"
+	"They can also help provide statistics about your journaling habits over time, such as how often you write about certain topics."
+)
+
 class LogEditorWindow(QMainWindow):
 	"""Basic editor window for a single Log instance.
 
@@ -30,21 +153,38 @@ class LogEditorWindow(QMainWindow):
 	Additional section buttons are stubbed for future features.
 	"""
 
+	# Emitted from the save worker: status text, error message ("" on
+	# success) and whether a failure should be reported to the user.
+	save_finished = pyqtSignal(str, str, bool)
+
 	def __init__(self, log: Log, parent: QWidget | None = None) -> None:
 		super().__init__(parent)
 		self.log = log
 		self._dirty = False
 		self._auto_save_timer: QTimer | None = None
+		# Background writes submitted but not yet finished.
+		self._saves_in_flight = 0
+		# Whether auto-saves since the last manual save already recorded
+		# their revision; see `_auto_save_if_dirty`.
+		self._auto_save_revised = False
+		self.save_finished.connect(self._on_save_finished, Qt.ConnectionType.QueuedConnection)
 
 		self.setWindowTitle("NBJournal - Log Editor")
 		self.resize(900, 700)
-
-		self.homescreen: HomeScreen | None = None
-		if parent and isinstance(parent, HomeScreen):
-			self.homescreen = parent
-
-		# Register this window as the currently active log editor.
-		log_editor_state.active_log_editor = self
+		# The homescreen parents every editor, so without this a closed
+		# editor (with its whole document) lives on as a hidden child.
+		self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+
+		# The parent HomeScreen, if that's what opened this editor.
+		self.homescreen = None
+		if parent is not None:
+			# Imported here so opening an editor on its own doesn't pull in
+			# the whole homescreen module.
+			from UI.Homescreen.homescreen import HomeScreen
+			if isinstance(parent, HomeScreen):
+				self.homescreen = parent
+		# Looked up once; called after every save.
+		self._on_log_saved_cb = getattr(self.homescreen, "_on_log_saved", None)
 
 		self._init_ui()
 		self._populate_from_log()
@@ -52,6 +192,9 @@ class LogEditorWindow(QMainWindow):
 
 	# --- UI setup -----------------------------------------------------
 	def _init_ui(self) -> None:
+		editor_settings = user_settings.log_editor
+		editor_font = editor_settings.get_font()
+
 		central = QWidget(self)
 		root_layout = QVBoxLayout()
 		root_layout.setContentsMargins(10, 10, 10, 10)
@@ -63,7 +206,7 @@ class LogEditorWindow(QMainWindow):
 		title_layout.setContentsMargins(0, 0, 0, 0)
 		title_label = QLabel("Title")
 		self.title_edit = QLineEdit()
-		self.title_edit.setFont(QFont(user_settings.log_editor.font, user_settings.log_editor.font_size))
+		self.title_edit.setFont(editor_font)
 		title_layout.addWidget(title_label)
 		title_layout.addWidget(self.title_edit)
 		self.title_container.setLayout(title_layout)
@@ -73,10 +216,9 @@ class LogEditorWindow(QMainWindow):
 		description_layout = QVBoxLayout()
 		description_layout.setContentsMargins(0, 0, 0, 0)
 		description_label = QLabel("Description")
-		self.description_edit = QTextEdit()
-		self.description_edit.setAcceptRichText(False)
+		self.description_edit = QPlainTextEdit()
 		self.description_edit.setFixedHeight(80)
-		self.description_edit.setFont(QFont(user_settings.log_editor.font, user_settings.log_editor.font_size))
+		self.description_edit.setFont(editor_font)
 		description_layout.addWidget(description_label)
 		description_layout.addWidget(self.description_edit)
 		self.description_container.setLayout(description_layout)
@@ -86,9 +228,10 @@ class LogEditorWindow(QMainWindow):
 		body_layout = QVBoxLayout()
 		body_layout.setContentsMargins(0, 0, 0, 0)
 		body_label = QLabel("Body (Markdown)")
-		self.body_edit = QTextEdit()
-		self.body_edit.setAcceptRichText(False)
-		self.body_edit.setFont(QFont(user_settings.log_editor.font, user_settings.log_editor.font_size))
+		# Plain text editor: the markdown is never rich text, and its
+		# layout scales far better than QTextEdit's on long bodies.
+		self.body_edit = QPlainTextEdit()
+		self.body_edit.setFont(editor_font)
 		body_layout.addWidget(body_label)
 		body_layout.addWidget(self.body_edit)
 		self.body_container.setLayout(body_layout)
@@ -99,6 +242,10 @@ class LogEditorWindow(QMainWindow):
 		self.status_label.setStyleSheet("color: #888888; font-size: 10px;")
 		self.status_label.setVisible(False)
 		actions_layout.addWidget(self.status_label)
+		# One timer hides the label; each new status restarts it.
+		self._status_timer = QTimer(self)
+		self._status_timer.setSingleShot(True)
+		self._status_timer.timeout.connect(self.status_label.hide)
 		actions_layout.addStretch(1)
 		self.btn_save = QPushButton("Save")
 		self.btn_save.setToolTip("Save log (Ctrl+S)")
@@ -127,93 +274,196 @@ class LogEditorWindow(QMainWindow):
 		self._view_mode = 0
 
 		# Set view mode from global settings
-		self._set_view_mode(user_settings.log_editor.default_view_mode)
+		self._set_view_mode(editor_settings.default_view_mode)
 
 		self._create_menu_bar()
 		self._create_shortcuts()
 		self._update_window_modified()
 
 	def _init_auto_save(self) -> None:
-		"""Initialize auto-save timer based on global settings interval (seconds)."""
-		from DataClasses.settings import user_settings
+		"""Initialize auto-save timer based on global settings interval (seconds).
 
+		The timer is single-shot and restarted by every edit, so an
+		auto-save happens once the user has been idle for the interval
+		after their last modification, never mid-typing.
+		"""
 		interval_seconds = user_settings.preferences.autosave_interval
 		if interval_seconds and interval_seconds > 0:
 			self._auto_save_timer = QTimer(self)
+			self._auto_save_timer.setSingleShot(True)
 			# QTimer interval is in milliseconds
 			self._auto_save_timer.setInterval(int(interval_seconds * 1000))
 			self._auto_save_timer.timeout.connect(self._auto_save_if_dirty)
-			self._auto_save_timer.start()
 
 	# --- Data binding -------------------------------------------------
 	def _populate_from_log(self) -> None:
 		"""Fill widgets from the current Log instance."""
-		self.title_edit.setText(self.log.name)
-		# Some logs may not yet have a description attribute
-		self.description_edit.setPlainText(getattr(self.log, "description", ""))
-		self.body_edit.setPlainText(self.log.body)
+		# Loading text isn't an edit; keep `textChanged` from marking the
+		# editor dirty for each widget only for that to be undone below.
+		widgets = (self.title_edit, self.description_edit, self.body_edit)
+		for widget in widgets:
+			widget.blockSignals(True)
+		try:
+			self.title_edit.setText(self.log.name)
+			# Some logs may not yet have a description attribute
+			self.description_edit.setPlainText(getattr(self.log, "description", ""))
+			self.body_edit.setPlainText(self.log.body)
+		finally:
+			for widget in widgets:
+				widget.blockSignals(False)
+		self._saved_content = self._editor_content()
 		self._dirty = False
 		self._update_window_modified()
 
-	def _update_log_from_widgets(self) -> None:
-		"""Copy data from widgets back into the Log instance."""
-		self.log.name = self.title_edit.text()
+	def _widget_content(self) -> tuple[str, str, str]:
+		"""Return the (title, description, body) currently in the widgets."""
+		return (
+			self.title_edit.text(),
+			self.description_edit.toPlainText(),
+			self.body_edit.toPlainText(),
+		)
+
+	def _editor_content(self) -> tuple[str, str, str, tuple[str, ...]]:
+		"""Return everything a save would write that this editor can change.
+
+		That is the widgets' (title, description, body) plus the names of
+		the log's tags, which the Tag Manager edits on the log directly.
+		"""
+		return (*self._widget_content(), tuple(t.name for t in self.log.tags))
+
+	def _update_log_from_widgets(
+		self,
+		revision: bool = True,
+		content: tuple[str, str, str, tuple[str, ...]] | None = None,
+	) -> None:
+		"""Copy data from widgets back into the Log instance.
+
+		Always updates the log's modified time; also records an entry in its
+		revision history unless `revision` is False. Callers that already
+		read the widgets can pass that `_editor_content()` result along.
+		"""
+		self._saved_content = content if content is not None else self._editor_content()
+		self.log.name, description, self.log.body, _tag_names = self._saved_content
 		# Keep description optional for backward compatibility
-		setattr(self.log, "description", self.description_edit.toPlainText())
-		self.log.body = self.body_edit.toPlainText()
-		self.log.add_revision()
+		setattr(self.log, "description", description)
+		if revision:
+			self.log.add_revision()
+		else:
+			# Content is changing either way, so "last modified" (and the
+			# newest-first list order) must follow it.
+			self.log.revised_at = datetime.utcnow()
 		self._dirty = False
 		self._update_window_modified()
 
 	# --- Actions ------------------------------------------------------
 	def save_log(self) -> None:
-		"""Update the Log object and persist it using its `save` method."""
+		"""Update the Log object and persist it on the save worker."""
+		self._save(background=True)
+
+	def _save(self, background: bool) -> None:
+		"""Save the log, writing the file on the save worker if `background`.
+
+		Closing the window saves in the foreground so the write is done
+		(or has failed) before the editor goes away. That write still goes
+		through the save worker, behind any queued auto-save, so an older
+		payload can't land after it.
+		"""
 		# If log has no title, prevent saving
 		if self.title_edit.text().strip() == "":
 			QMessageBox.warning(self, "Warning", "Log must have a title before saving.")
 			return
 
 		self._update_log_from_widgets()
+		self._auto_save_revised = False
 		try:
-			self.log.save()
+			payload = self.log.serialize_for_save()
+			if not background:
+				save_executor.submit(self.log.write_serialized, payload).result()
 		except Exception as exc:  # pragma: no cover - UI feedback
 			QMessageBox.critical(self, "Error", f"Failed to save log:\n{exc}")
 			return
 
-		self._show_status("Saved")
-
-		# Notify the homescreen (if available) that a log was saved so
-		# it can refresh the logs list via its LogsViewer.
-		if self.homescreen is not None:
-			try:
-				self.homescreen._on_log_saved(self.log)
-			except Exception:
-				pass
+		self._notify_log_saved()
+		if background:
+			self._write_in_background(payload, "Saved", report_errors=True)
+		else:
+			self._show_status("Saved")
 
 	def _auto_save_if_dirty(self) -> None:
 		"""Auto-save the log if there are unsaved changes."""
 		if not self._dirty:
 			return
+		# Read the widgets once; serializing the body document is the
+		# expensive part and everything below works from this copy.
+		content = self._editor_content()
 		# Avoid modal dialogs for auto-save; just skip if invalid.
-		if self.title_edit.text().strip() == "":
+		if content[0].strip() == "":
 			return
-		self._update_log_from_widgets()
+		# Edits that were undone back to the saved text need no write (and
+		# no new revision).
+		if content == self._saved_content:
+			self._dirty = False
+			self._update_window_modified()
+			return
+		# Don't queue up behind a write that's still running; the changes
+		# stay dirty and go out once the timer fires again.
+		if self._saves_in_flight:
+			self._auto_save_timer.start()
+			return
+		# Every auto-save updates the modified time, but only the first one
+		# after a manual save adds to the revision history, so a long
+		# session of idle pauses doesn't fill it.
+		self._update_log_from_widgets(revision=not self._auto_save_revised, content=content)
+		self._auto_save_revised = True
 		try:
-			self.log.save()
+			payload = self.log.serialize_for_save()
 		except Exception:
 			return
-		
-		# Update homescreen if applicable
-		if self.homescreen is not None:
+
+		self._notify_log_saved()
+		self._write_in_background(payload, "Auto-saved", report_errors=False)
+
+	def _notify_log_saved(self) -> None:
+		"""Tell the homescreen (if available) to refresh its logs list.
+
+		The in-memory log is already up to date at this point, so this
+		doesn't wait for the file write.
+		"""
+		if self._on_log_saved_cb is not None:
+			self._on_log_saved_cb(self.log)
+
+	def _write_in_background(self, payload: str, status: str, report_errors: bool) -> None:
+		"""Write `payload` to the log's file on the save worker."""
+		self._saves_in_flight += 1
+		future = save_executor.submit(self.log.write_serialized, payload)
+
+		def done(f: Future) -> None:
+			exc = f.exception()
 			try:
-				self.homescreen._on_log_saved(self.log)
-			except Exception:
+				self.save_finished.emit(status, "" if exc is None else str(exc), report_errors)
+			except RuntimeError:
+				# The window was destroyed before the write finished.
 				pass
-			
-		self._show_status("Auto-saved")
+
+		future.add_done_callback(done)
+
+	def _on_save_finished(self, status: str, error: str, report_errors: bool) -> None:
+		"""Report a background write's result on the GUI thread."""
+		self._saves_in_flight -= 1
+		if error:
+			if report_errors:
+				QMessageBox.critical(self, "Error", f"Failed to save log:\n{error}")
+			return
+		self._show_status(status)
 
 	def _mark_dirty(self) -> None:
 		"""Mark the editor as having unsaved changes."""
+		# Push the auto-save back until editing pauses.
+		if self._auto_save_timer is not None:
+			self._auto_save_timer.start()
+		# Runs on every keystroke; the title only changes on the first.
+		if self._dirty:
+			return
 		self._dirty = True
 		self._update_window_modified()
 
@@ -235,63 +485,33 @@ class LogEditorWindow(QMainWindow):
 		"""Show a small transient text label indicating save status."""
 		self.status_label.setText(text)
 		self.status_label.setVisible(True)
-		QTimer.singleShot(duration_ms, lambda: self.status_label.setVisible(False))
+		self._status_timer.start(duration_ms)
 
 	def _create_shortcuts(self) -> None:
-		"""Create keyboard shortcut stubs for common actions.
+		"""Create keyboard shortcuts for actions that have no menu entry.
 
-		Currently wires basic shortcuts to existing slots where possible and
-		leaves room for future expansion.
+		Everything in the menu bar carries its own shortcut; see
+		`_create_menu_bar`.
 		"""
-		from PyQt6.QtGui import QShortcut, QKeySequence
-
 		# Save (Ctrl+S)
 		QShortcut(QKeySequence.StandardKey.Save, self, activated=self.save_log)
 
 		# Close editor (Ctrl+W)
 		QShortcut(QKeySequence("Ctrl+W"), self, activated=self.close)
 
-		# Insert helpers (stubs already mapped to menu actions)
-		# Heading shortcuts
-		QShortcut(QKeySequence("Ctrl+1"), self, activated=lambda: self._insert_text_at_cursor("# "))
-		QShortcut(QKeySequence("Ctrl+2"), self, activated=lambda: self._insert_text_at_cursor("## "))
-		QShortcut(QKeySequence("Ctrl+3"), self, activated=lambda: self._insert_text_at_cursor("### "))
-
-		# Text formatting
-		QShortcut(QKeySequence("Ctrl+B"), self, activated=lambda: self._insert_text_at_cursor("****", 2))
-		QShortcut(QKeySequence("Ctrl+I"), self, activated=lambda: self._insert_text_at_cursor("**", 1))
-		QShortcut(QKeySequence("Ctrl+Shift+B"), self, activated=lambda: self._insert_text_at_cursor("******", 3))
-		QShortcut(QKeySequence("Ctrl+T"), self, activated=lambda: self._insert_text_at_cursor("~~~~", 2))
-		QShortcut(QKeySequence("Ctrl+`"), self, activated=lambda: self._insert_text_at_cursor("``", 1))
-
-		# Lists and code blocks
-		QShortcut(QKeySequence("Ctrl+L"), self, activated=self._insert_bullet_list)
-		QShortcut(QKeySequence("Ctrl+Shift+L"), self, activated=self._insert_numbered_list)
-		QShortcut(QKeySequence("Ctrl+Shift+C"), self, activated=lambda: self._insert_text_at_cursor("```\n\n```", 4))
-		QShortcut(QKeySequence("Ctrl+Shift+T"), self, activated=self._insert_task_list)
-
-		# Horizontal rule
-		QShortcut(QKeySequence("Ctrl+R"), self, activated=lambda: self._insert_text_at_cursor("\n---\n"))
-
-		# Insert link to website
-		QShortcut(QKeySequence("Ctrl+K"), self, activated=lambda: self._insert_text_at_cursor("[]()", 3))
-		# Insert link to file/folder, open file dialog
-		QShortcut(QKeySequence("Ctrl+Shift+K"), self, activated=self._insert_file_link)
-
-		# Tag manager/editor
-		QShortcut(QKeySequence("Ctrl+Shift+M"), self, activated=self._open_tag_manager)
-		QShortcut(QKeySequence("Ctrl+Shift+E"), self, activated=self._open_tag_editor)
-
-		# Cycle view modes (Ctrl+Shift+V)
-		QShortcut(QKeySequence("Ctrl+Shift+V"), self, activated=self._cycle_view_mode)
-
-		# Set view modes
-		QShortcut(QKeySequence("Ctrl+Shift+A"), self, activated=lambda: self._set_view_mode(0))
-		QShortcut(QKeySequence("Ctrl+Shift+S"), self, activated=lambda: self._set_view_mode(1))
-		QShortcut(QKeySequence("Ctrl+Shift+D"), self, activated=lambda: self._set_view_mode(2))
+	def showEvent(self, event):  # type: ignore[override]
+		"""Register this window as the currently active log editor."""
+		# Done here rather than in __init__ so an editor that fails to
+		# construct never becomes the active one.
+		log_editor_state.active_log_editor = self
+		super().showEvent(event)
 
 	def closeEvent(self, event):  # type: ignore[override]
 		"""Prompt to save if there are unsaved changes before closing."""
+		# Edits that were undone back to the saved text aren't worth a
+		# prompt. Tags count too: Tag Manager changes must not be dropped.
+		if self._dirty and self._editor_content() == self._saved_content:
+			self._dirty = False
 		if self._dirty:
 			res = QMessageBox.question(
 				self,
@@ -306,7 +526,7 @@ class LogEditorWindow(QMainWindow):
 				event.ignore()
 				return
 			elif res == QMessageBox.StandardButton.Yes:
-				self.save_log()
+				self._save(background=False)
 				# If still dirty (e.g. save failed), do not close.
 				if self._dirty:
 					event.ignore()
@@ -315,13 +535,41 @@ class LogEditorWindow(QMainWindow):
 		# Clear global reference when the window is actually closing.
 		log_editor_state.active_log_editor = None
 
-		# Auto save timer cleanup
+		# Tag windows opened from here are deleted along with this one;
+		# close them first so they clear their own shared state.
+		for window in (tag_manager_state.active_tag_manager, tag_editor_state.active_tag_editor):
+			if window is not None and window.parent() is self:
+				window.close()
+
+		self._stop_auto_save()
+
+		event.accept()
+
+	def _stop_auto_save(self) -> None:
+		"""Stop and release the auto-save timer, if there is one."""
 		if self._auto_save_timer is not None:
 			self._auto_save_timer.stop()
 			self._auto_save_timer.deleteLater()
 			self._auto_save_timer = None
 
-		event.accept()
+	def _add_action(self, menu, label: str, keys: str | None, slot) -> QAction:
+		"""Add an action calling `slot` to `menu`, with an optional shortcut.
+
+		The shortcut works anywhere in the window, and the menu shows it
+		next to the label.
+		"""
+		action = QAction(label, self)
+		if keys is not None:
+			action.setShortcut(QKeySequence(keys))
+		# `triggered` passes a `checked` flag the slots don't take.
+		action.triggered.connect(lambda _checked=False: slot())
+		menu.addAction(action)
+		return action
+
+	def _add_insert_action(self, menu, label: str) -> QAction:
+		"""Add the `_INSERT_ACTIONS` entry for `label` to `menu`."""
+		keys, text, position = _INSERT_ACTIONS[label]
+		return self._add_action(menu, label, keys, partial(self._insert_text_at_cursor, text, position))
 
 	def _create_menu_bar(self):
 		menuBar = self.menuBar()
@@ -331,85 +579,34 @@ class LogEditorWindow(QMainWindow):
 
 		# Various markdown elements
 		heading_section = insertMenu.addMenu("Heading")
-
-		self.heading1_action = QAction("Heading 1 (ctrl+1)", self)
-		self.heading1_action.triggered.connect(lambda: self._insert_text_at_cursor("# "))
-		heading_section.addAction(self.heading1_action)
-
-		self.heading2_action = QAction("Heading 2 (ctrl+2)", self)
-		self.heading2_action.triggered.connect(lambda: self._insert_text_at_cursor("## "))
-		heading_section.addAction(self.heading2_action)
-
-		self.heading3_action = QAction("Heading 3 (ctrl+3)", self)
-		self.heading3_action.triggered.connect(lambda: self._insert_text_at_cursor("### "))
-		heading_section.addAction(self.heading3_action)
+		for label in ("Heading 1", "Heading 2", "Heading 3"):
+			self._add_insert_action(heading_section, label)
 
 		text_formatting = insertMenu.addMenu("Text Formatting")
+		for label in ("Bold", "Italic", "Bold + Italic", "Strikethrough", "Inline Code"):
+			self._add_insert_action(text_formatting, label)
 
-		self.bold_action = QAction("Bold (ctrl+B)", self)
-		self.bold_action.triggered.connect(lambda: self._insert_text_at_cursor("****", 2))
-		text_formatting.addAction(self.bold_action)
-
-		self.italic_action = QAction("Italic (ctrl+I)", self)
-		self.italic_action.triggered.connect(lambda: self._insert_text_at_cursor("**", 1))
-		text_formatting.addAction(self.italic_action)
-
-		self.bold_italic_action = QAction("Bold + Italic (ctrl+Shift+B)", self)
-		self.bold_italic_action.triggered.connect(lambda: self._insert_text_at_cursor("******", 3))
-		text_formatting.addAction(self.bold_italic_action)
-
-		self.strikethrough_action = QAction("Strikethrough (ctrl+T)", self)
-		self.strikethrough_action.triggered.connect(lambda: self._insert_text_at_cursor("~~~~", 2))
-		text_formatting.addAction(self.strikethrough_action)
-
-		self.inline_code_action = QAction("Inline Code (ctrl+`)", self)
-		self.inline_code_action.triggered.connect(lambda: self._insert_text_at_cursor("``", 1))
-		text_formatting.addAction(self.inline_code_action)
-
-		self.code_block_action = QAction("Code Block (ctrl+Shift+C)", self)
-		self.code_block_action.triggered.connect(lambda: self._insert_text_at_cursor("```\n\n```", 4))
-		insertMenu.addAction(self.code_block_action)
+		self._add_insert_action(insertMenu, "Code Block")
 
 		insertMenu.addSeparator()
 
-		self.bullet_list_action = QAction("Bullet List (ctrl+L)", self)
-		self.bullet_list_action.triggered.connect(self._insert_bullet_list)
-		insertMenu.addAction(self.bullet_list_action)
-
-		self.numbered_list_action = QAction("Numbered List (ctrl+Shift+L)", self)
-		self.numbered_list_action.triggered.connect(self._insert_numbered_list)
-		insertMenu.addAction(self.numbered_list_action)
-
-		self.task_list_action = QAction("Task List (ctrl+Shift+T)", self)
-		self.task_list_action.triggered.connect(self._insert_task_list)
-		insertMenu.addAction(self.task_list_action)
+		self._add_action(insertMenu, "Bullet List", "Ctrl+L", self._insert_bullet_list)
+		self._add_action(insertMenu, "Numbered List", "Ctrl+Shift+L", self._insert_numbered_list)
+		self._add_action(insertMenu, "Task List", "Ctrl+Shift+T", self._insert_task_list)
 
 		insertMenu.addSeparator()
 
-		self.horizontal_rule_action = QAction("Horizontal Rule (ctrl+R)", self)
-		self.horizontal_rule_action.triggered.connect(lambda: self._insert_text_at_cursor("\n---\n"))
-		insertMenu.addAction(self.horizontal_rule_action)
+		self._add_insert_action(insertMenu, "Horizontal Rule")
 
 		insertMenu.addSeparator()
 
-		self.link_action = QAction("Insert Link (ctrl+K)", self)
-		self.link_action.triggered.connect(lambda: self._insert_text_at_cursor("[]()", 3))
-		insertMenu.addAction(self.link_action)
-
-		self.file_link_action = QAction("Insert File/Folder Link (ctrl+Shift+K)", self)
-		self.file_link_action.triggered.connect(self._insert_file_link)
-		insertMenu.addAction(self.file_link_action)
+		self._add_insert_action(insertMenu, "Insert Link")
+		self._add_action(insertMenu, "Insert File/Folder Link", "Ctrl+Shift+K", self._insert_file_link)
 
 		# Tag submenu containing Tag Manager and Tag Editor
 		tagMenu = menuBar.addMenu("Tag")
-
-		self.tag_manager_action = QAction("Tag Manager (ctrl+Shift+M)", self)
-		self.tag_manager_action.triggered.connect(self._open_tag_manager)
-		tagMenu.addAction(self.tag_manager_action)
-
-		self.tag_editor_action = QAction("Tag Editor (ctrl+Shift+E)", self)
-		self.tag_editor_action.triggered.connect(self._open_tag_editor)
-		tagMenu.addAction(self.tag_editor_action)
+		self._add_action(tagMenu, "Tag Manager", "Ctrl+Shift+M", self._open_tag_manager)
+		self._add_action(tagMenu, "Tag Editor", "Ctrl+Shift+E", self._open_tag_editor)
 
 		# View menu
 		viewMenu = menuBar.addMenu("View")
@@ -421,96 +618,14 @@ class LogEditorWindow(QMainWindow):
 
 		# Layout submenu for mode switching
 		layoutMenu = menuBar.addMenu("Layout")
-		self.cycle_view_action = QAction("Cycle View Modes (Ctrl+Shift+V)", self)
-		self.cycle_view_action.triggered.connect(self._cycle_view_mode)
-		layoutMenu.addAction(self.cycle_view_action)
-
-		self.title_desc_body_action = QAction("Title+Description+Body (ctrl+Shift+A)", self)
-		layoutMenu.addAction(self.title_desc_body_action)
-		self.title_desc_body_action.triggered.connect(lambda: self._set_view_mode(0))
-
-		self.title_body_action = QAction("Title+Body (ctrl+Shift+S)", self)
-		layoutMenu.addAction(self.title_body_action)
-		self.title_body_action.triggered.connect(lambda: self._set_view_mode(1))
-
-		self.body_only_action = QAction("Body Only (ctrl+Shift+D)", self)
-		layoutMenu.addAction(self.body_only_action)
-		self.body_only_action.triggered.connect(lambda: self._set_view_mode(2))
+		self._add_action(layoutMenu, "Cycle View Modes", "Ctrl+Shift+V", self._cycle_view_mode)
+		self._add_action(layoutMenu, "Title+Description+Body", "Ctrl+Shift+A", partial(self._set_view_mode, 0))
+		self._add_action(layoutMenu, "Title+Body", "Ctrl+Shift+S", partial(self._set_view_mode, 1))
+		self._add_action(layoutMenu, "Body Only", "Ctrl+Shift+D", partial(self._set_view_mode, 2))
 
 		# Help menu
 		helpMenu = menuBar.addMenu("Help")
 
-		HELP_MARKDOWN_GUIDE = """
-MARKDOWN QUICK GUIDE (FOR JOURNAL ENTRIES)
-=========================================
-
-BASIC FORMATTING
-----------------
-Bold:        **text**
-Italic:      *text*
-Bold+Italic: ***text***
-Strikethrough: ~~text~~
-
-HEADINGS
---------
-# Heading 1
-## Heading 2
-### Heading 3
-
-LISTS
------
-Bullet list:
-- item one
-- item two
-
-Numbered list:
-1. first item
-2. second item
-
-TASK LISTS (CHECKBOXES)
------------------------
-- [ ] thing to do
-- [x] finished thing
-
-HORIZONTAL LINE
----------------
-Use three dashes:
----
-
-CODE
-----
-Inline code example:
-Use `print("hi")` format for inline code.
-
-Code block example (indent by four spaces):
-    print("Hello journal!")
-
-LINKS (WEB, FILES, FOLDERS)
----------------------------
-Web link example:
-[Example](https://example.com)
-
-Link to a file (opens in your system's default app):
-[My PDF](file:///C:/Users/you/Documents/notes.pdf)
-[Notes](file:///home/you/Documents/notes.txt)
-
-Link to a folder (opens file explorer):
-[Journal Folder](file:///C:/Users/you/Documents/Journal/)
-[Projects](file:///home/you/Projects/)
-
-TIPS FOR FILE LINKS
--------------------
-- Use: file:/// + full absolute path
-- Windows paths: C:/Users/you/Documents/...
-- Spaces in paths usually work fine
-- Make sure the file or folder actually exists
-
-GOOD HABITS
------------
-- Prefer absolute paths
-- Avoid moving files after linking them
-- Double-check path spelling if something won't open
-"""
 		self.markdown_help_action = QAction("Markdown Guide", self)
 		self.markdown_help_action.triggered.connect(lambda: QMessageBox.information(
 			self,
@@ -523,12 +638,7 @@ GOOD HABITS
 		self.tag_guide.triggered.connect(lambda: QMessageBox.information(
 			self,
 			"Tagging Quick Guide",
-			"Tags are labels you can assign to your journal entries to help organize and categorize them.\n\n"
-			"To manage your tags, use the Tag Manager from the Tag menu. You can add new tags or remove existing ones there.\n\n"
-			"To create, edit, or delete tags in detail, use the Tag Editor also found in the Tag menu.\n\n"
-			"Once you have tags created, you can assign them to your journal entries while editing a log.\n\n"
-			"Tags help you filter and find related entries easily in the Homescreen view.\n\n"
-			"They can also help provide statistics about your journaling habits over time, such as how often you write about certain topics."
+			HELP_TAGGING_GUIDE
 		))
 		helpMenu.addAction(self.tag_guide)
 
@@ -536,13 +646,12 @@ GOOD HABITS
 		"""Insert the given text at the current cursor position in the body editor."""
 		cursor = self.body_edit.textCursor()
 		cursor.insertText(text)
-		self.body_edit.setTextCursor(cursor)
-		self._mark_dirty()
-
 		if position is not None:
 			# Move cursor to specified position relative to insertion point
 			cursor.setPosition(cursor.position() - position)
-			self.body_edit.setTextCursor(cursor)
+		# Hand the cursor back once, after it is in its final place.
+		self.body_edit.setTextCursor(cursor)
+		self._mark_dirty()
 
 	def _current_line_info(self):
 		"""Return (cursor, line_text, line_start, line_end) for current line."""
@@ -573,15 +682,13 @@ GOOD HABITS
 			cursor.beginEditBlock()
 			cursor.setPosition(line_start)
 			cursor.insertText(f"{indent}- \n{indent}- ")
-			# Place cursor after second "- "
-			cursor.setPosition(line_start + len(f"{indent}- \n{indent}- "))
+			# insertText leaves the cursor after the second "- ".
 			cursor.endEditBlock()
 		else:
 			# Extend existing list: add a new item on the next line.
 			cursor.beginEditBlock()
 			cursor.setPosition(line_end)
 			cursor.insertText(f"\n{indent}- ")
-			cursor.setPosition(line_end + len(f"\n{indent}- "))
 			cursor.endEditBlock()
 
 		self.body_edit.setTextCursor(cursor)
@@ -593,7 +700,7 @@ GOOD HABITS
 		Behavior mirrors bullet lists but uses "1.", "2.", etc. When
 		extending an existing list, the new item number is the next
 		integer after the highest number found in the list up to the
-		current line (simple upward scan within the same indentation).
+		current line (upward scan over the list at the same indentation).
 		"""
 		cursor, line_text, line_start, line_end = self._current_line_info()
 		leading = line_text.lstrip()
@@ -601,38 +708,40 @@ GOOD HABITS
 		indent = line_text[:indent_len]
 
 		# Detect if line starts with something like "1. "
-		import re
-		m = re.match(r"^(\d+)\.\s", leading)
-		is_numbered = m is not None
+		num = _parse_numbered_prefix(leading)
+		is_numbered = num is not None
 
 		if not is_numbered:
 			# Start a new list: "1." and "2." items.
 			cursor.beginEditBlock()
 			cursor.setPosition(line_start)
 			cursor.insertText(f"{indent}1. \n{indent}2. ")
-			cursor.setPosition(line_start + len(f"{indent}1. \n{indent}2. "))
 			cursor.endEditBlock()
 		else:
 			# Determine next number by looking at lines above with same indentation.
 			block = cursor.block()
-			import re as _re
-			max_num = int(m.group(1))
+			max_num = num
+			# The scan ends at the first line at this indentation that isn't a
+			# numbered item, so it only covers the list itself rather than the
+			# whole document above it. Blank lines and more deeply indented
+			# lines (nested items, continuations) are stepped over.
 			b = block.previous()
 			while b.isValid():
 				text = b.text()
 				if not text.startswith(indent):
 					break
 				lead = text[len(indent):]
-				m2 = _re.match(r"^(\d+)\.\s", lead)
-				if m2:
-					max_num = max(max_num, int(m2.group(1)))
+				if lead and not lead[0].isspace():
+					num = _parse_numbered_prefix(lead)
+					if num is None:
+						break
+					max_num = max(max_num, num)
 				b = b.previous()
 
 			next_num = max_num + 1
 			cursor.beginEditBlock()
 			cursor.setPosition(line_end)
 			cursor.insertText(f"\n{indent}{next_num}. ")
-			cursor.setPosition(line_end + len(f"\n{indent}{next_num}. "))
 			cursor.endEditBlock()
 
 		self.body_edit.setTextCursor(cursor)
@@ -653,20 +762,17 @@ GOOD HABITS
 		indent = line_text[:indent_len]
 
 		# Match "- [ ] ", "- [x] ", "- [X] " etc. at line start (ignoring indent).
-		import re
-		is_task = re.match(r"^- \[[ xX]\] \s*", leading) is not None
+		is_task = _RE_TASK.match(leading) is not None
 
 		if not is_task:
 			cursor.beginEditBlock()
 			cursor.setPosition(line_start)
 			cursor.insertText(f"{indent}- [ ] \n{indent}- [ ] ")
-			cursor.setPosition(line_start + len(f"{indent}- [ ] \n{indent}- [ ] "))
 			cursor.endEditBlock()
 		else:
 			cursor.beginEditBlock()
 			cursor.setPosition(line_end)
 			cursor.insertText(f"\n{indent}- [ ] ")
-			cursor.setPosition(line_end + len(f"\n{indent}- [ ] "))
 			cursor.endEditBlock()
 
 		self.body_edit.setTextCursor(cursor)
@@ -678,10 +784,6 @@ GOOD HABITS
 		Prevents opening if the Tag Editor (from homescreen) is active
 		by checking shared global state.
 		"""
-		from UI.TagManager.tag_manager import TagManagerWindow  # type: ignore[import]
-		from UI.TagEditor import state as tag_editor_state
-		from UI.TagManager import state as tag_manager_state
-
 		# If the Tag Editor is open, do not allow Tag Manager
 		if getattr(tag_editor_state, "active_tag_editor", None) is not None:
 			QMessageBox.information(
@@ -705,22 +807,17 @@ GOOD HABITS
 			QMessageBox.warning(self, "No Log", "No log is loaded in this editor.")
 			return
 
-		mgr = TagManagerWindow(self.log, parent=self)
+		# The manager edits `self.log.tags` in place and reports each
+		# toggle, so the change is saved like any other edit.
+		mgr = TagManagerWindow(self.log, parent=self, on_change=self._mark_dirty)
 		mgr.show()
 
-		# Mark as dirty since tags changed
-		self._mark_dirty()
-
 	def _open_tag_editor(self) -> None:
 		"""Open the Tag Editor window from the log editor.
 
 		Also respects the shared state so it cannot be opened while
 		the Tag Manager is active.
 		"""
-		from UI.TagEditor.tag_editor import TagEditorWindow  # type: ignore[import]
-		from UI.TagEditor import state as tag_editor_state
-		from UI.TagManager import state as tag_manager_state
-
 		# If Tag Manager is open, do not open Tag Editor.
 		if getattr(tag_manager_state, "active_tag_manager", None) is not None:
 			QMessageBox.information(
@@ -1,3 +1,6 @@
+import functools
+from typing import Any, Callable
+
 from PyQt6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -13,25 +16,46 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QMessageBox,
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFontDatabase, QFont, QKeySequence, QShortcut
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtGui import QKeySequence, QShortcut
 from UI.Homescreen.state import active_homescreen
 import DataClasses.settings as settings
+from AIFeatures.openai_prompter import clear_feature_flag_cache
 
 
+@functools.lru_cache(maxsize=None)
 def snake_to_title(snake_str: str) -> str:
     """Convert snake_case string to Title Case."""
     components = snake_str.split('_')
     return ' '.join(x.title() for x in components)
 
 
+class _ClickableLabel(QLabel):
+    """QLabel that emits `clicked` when pressed."""
+
+    clicked = pyqtSignal()
+
+    def mousePressEvent(self, event):  # type: ignore[override]
+        super().mousePressEvent(event)
+        self.clicked.emit()
+
+
 class SettingsWindow(QDialog):
+    # Widget type -> function reading its current value back out.
+    _EXTRACTORS = {
+        QCheckBox: lambda w: w.isChecked(),
+        QSpinBox: lambda w: w.value(),
+        QLineEdit: lambda w: w.text(),
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("NBJournal - Settings")
         self.resize(400, 500)
 
-        self._widgets = {}  # (group_name, field_name) -> widget
+        # (settings group, field name, widget, reader returning the value
+        # to store), one per field, built with the form.
+        self._entries: list[tuple[object, str, QWidget, Callable[[QWidget], Any]]] = []
 
         main_layout = QVBoxLayout(self)
 
@@ -93,13 +117,21 @@ class SettingsWindow(QDialog):
             for field_name, field_def in group_obj.__dataclass_fields__.items():  # type: ignore[attr-defined]
                 value = getattr(group_obj, field_name)
                 widget = self._make_widget_for_value(field_name, value)
-                self._widgets[(group_name, field_name)] = widget
+                self._entries.append((group_obj, field_name, widget, self._make_reader(widget, value)))
 
                 label_text = snake_to_title(field_name)
-                label_widget = QLabel(label_text)
 
-                # Look for optional tooltip in dataclass field metadata
-                tooltip = field_def.metadata.get("tooltip") if getattr(field_def, "metadata", None) else None
+                # Optional tooltip, restart flag and click action all come
+                # from the dataclass field metadata.
+                metadata = getattr(field_def, "metadata", None) or {}
+                click_action = metadata.get("click")
+                if click_action:
+                    label_widget = _ClickableLabel(label_text)
+                    label_widget.clicked.connect(click_action)
+                else:
+                    label_widget = QLabel(label_text)
+
+                tooltip = metadata.get("tooltip")
                 if tooltip:
                     # Subtle visual cue that this label has more info.
                     # We avoid changing colors (they're palette-driven) and
@@ -109,21 +141,12 @@ class SettingsWindow(QDialog):
                     widget.setToolTip(tooltip)
 
                 # Check if this field requires app restart
-                requires_restart = field_def.metadata.get("requires_restart") if getattr(field_def, "metadata", None) else False
+                requires_restart = metadata.get("requires_restart", False)
                 if requires_restart:
                     # Subtle visual cue that this label requires restart.
                     label_text += "!"
 
                 label_widget.setText(f"{label_text}")
-                
-                # If there's a click action, connect it
-                click_action = field_def.metadata.get("click") if getattr(field_def, "metadata", None) else None
-                if click_action:
-                    def make_handler(action):
-                        def handler():
-                            action()
-                        return handler
-                    label_widget.mousePressEvent = lambda event, act=click_action: make_handler(act)()
 
                 form.addRow(label_widget, widget)
 
@@ -148,35 +171,37 @@ class SettingsWindow(QDialog):
             le.setText(str(value))
             return le
 
+    def _make_reader(self, widget, value) -> Callable[[QWidget], Any]:
+        """Return a function reading the value to store from ``widget``.
+
+        ``value`` is the field's current value, used to pick the type.
+        """
+        extractor = self._EXTRACTORS.get(type(widget))
+        if extractor is None:
+            return lambda w: value
+
+        # Preserve type: if original was int but editor is line, try cast
+        if isinstance(widget, QLineEdit) and isinstance(value, int):
+            def read_int(w):
+                try:
+                    return int(extractor(w))
+                except ValueError:
+                    return value
+            return read_int
+
+        return extractor
+
     def _on_save(self) -> None:
         """Write widget values back into settings and persist."""
         us = settings.user_settings
 
-        for (group_name, field_name), widget in self._widgets.items():
-            group_obj = getattr(us, group_name, None)
-            if group_obj is None:
-                continue
-
-            old_value = getattr(group_obj, field_name)
-
-            if isinstance(widget, QCheckBox):
-                new_value = widget.isChecked()
-            elif isinstance(widget, QSpinBox):
-                new_value = widget.value()
-            elif isinstance(widget, QLineEdit):
-                # Preserve type: if original was int but editor is line, try cast
-                text = widget.text()
-                if isinstance(old_value, int):
-                    try:
-                        new_value = int(text)
-                    except ValueError:
-                        new_value = old_value
-                else:
-                    new_value = text
-            else:
-                new_value = old_value
+        for group_obj, field_name, widget, read in self._entries:
+            setattr(group_obj, field_name, read(widget))
 
-            setattr(group_obj, field_name, new_value)
+        # AI feature toggles may have changed; drop the cached flags. Done
+        # before saving because the in-memory settings above stay changed
+        # even if validation below rejects them.
+        clear_feature_flag_cache()
 
         # Persist to disk
         try:
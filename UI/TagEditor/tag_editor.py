@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import Future
 from enum import Enum, auto
 from typing import Optional
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont, QKeySequence, QShortcut
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QKeySequence, QShortcut
 from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -13,18 +15,29 @@ from PyQt6.QtWidgets import (
     QListWidgetItem,
     QMainWindow,
     QMessageBox,
+    QPlainTextEdit,
     QPushButton,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
 from DataClasses.settings import user_settings
-from DataClasses.tag import Tag, tags as global_tags
-from DataClasses.log import logs as global_logs
+from DataClasses.tag import TAGS_FOLDER, Tag, tags as global_tags, tags_by_name as global_tags_by_name
+from DataClasses.log import Log, logs as global_logs, save_executor
+from Helpers.file_io import remove_if_exists
 from UI.TagEditor import state as tag_editor_state
 
 
+def _write_logs(payloads: list[tuple[Log, str]]) -> None:
+    """Write serialized logs to disk; runs on the save worker."""
+    for log, payload in payloads:
+        try:
+            log.write_serialized(payload)
+        except Exception:
+            # If a log fails to save, continue with others
+            continue
+
+
 class EditorState(Enum):
     IDLE = auto()
     CREATING = auto()
@@ -40,6 +53,9 @@ class TagEditorWindow(QMainWindow):
     - Uses global `tags` list from `DataClasses.tag`
     """
 
+    # Emitted from the save worker once a batch of log writes is done.
+    logs_flushed = pyqtSignal()
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
 
@@ -47,7 +63,12 @@ class TagEditorWindow(QMainWindow):
         self.resize(600, 450)
 
         self._current_tag: Optional[Tag] = None
+        # Tag whose unedited name/description the fields currently show.
+        self._loaded_tag: Optional[Tag] = None
         self._state: EditorState = EditorState.IDLE
+        # Batches of log writes submitted but not yet finished.
+        self._flushes_in_flight = 0
+        self.logs_flushed.connect(self._on_logs_flushed, Qt.ConnectionType.QueuedConnection)
 
         # Register this window as the active tag editor.
         tag_editor_state.active_tag_editor = self
@@ -61,6 +82,8 @@ class TagEditorWindow(QMainWindow):
 
     # --- UI setup -------------------------------------------------
     def _init_ui(self) -> None:
+        editor_font = user_settings.log_editor.get_font()
+
         central = QWidget(self)
         root_layout = QHBoxLayout()
         root_layout.setContentsMargins(10, 10, 10, 10)
@@ -95,12 +118,11 @@ class TagEditorWindow(QMainWindow):
 
         name_label = QLabel("Name")
         self.name_edit = QLineEdit()
-        self.name_edit.setFont(QFont(user_settings.log_editor.font, user_settings.log_editor.font_size))
+        self.name_edit.setFont(editor_font)
 
         desc_label = QLabel("Description")
-        self.desc_edit = QTextEdit()
-        self.desc_edit.setAcceptRichText(False)
-        self.desc_edit.setFont(QFont(user_settings.log_editor.font, user_settings.log_editor.font_size))
+        self.desc_edit = QPlainTextEdit()
+        self.desc_edit.setFont(editor_font)
 
         actions_row = QHBoxLayout()
         self.btn_save = QPushButton("Save")
@@ -152,14 +174,22 @@ class TagEditorWindow(QMainWindow):
         # Close window (Ctrl+W)
         QShortcut(QKeySequence("Ctrl+W"), self, activated=self.close)
 
-        # Edit tag (Enter/space)
-        QShortcut(QKeySequence("Enter"), self, activated=lambda: self._on_item_double_clicked(self._current_item()) if self._current_item() else None)
-        QShortcut(QKeySequence("Return"), self, activated=lambda: self._on_item_double_clicked(self._current_item()) if self._current_item() else None)
-        QShortcut(QKeySequence("Space"), self, activated=lambda: self._on_item_double_clicked(self._current_item()) if self._current_item() else None)
+        # Edit tag (Enter/space). _on_item_double_clicked ignores None, so
+        # the selection is only looked up once per key press.
+        def edit_current() -> None:
+            self._on_item_double_clicked(self._current_item())
+
+        QShortcut(QKeySequence("Enter"), self, activated=edit_current)
+        QShortcut(QKeySequence("Return"), self, activated=edit_current)
+        QShortcut(QKeySequence("Space"), self, activated=edit_current)
 
     # --- State handling -------------------------------------------
     def _set_state(self, state: EditorState) -> None:
         self._state = state
+        if state in (EditorState.CREATING, EditorState.EDITING):
+            # The fields are about to be edited, so stop treating them as
+            # showing the tag.
+            self._loaded_tag = None
         self._apply_state()
 
     def _apply_state(self) -> None:
@@ -168,18 +198,19 @@ class TagEditorWindow(QMainWindow):
         self.name_edit.setEnabled(editable)
         self.desc_edit.setEnabled(editable)
 
-        # Save/Cancel only make sense while creating or editing
-        self.btn_save.setEnabled(editable)
+        # Save/Cancel only make sense while creating or editing. Save and
+        # Delete also wait for logs from the last rename/delete to be written.
+        busy = self._flushes_in_flight > 0
+        self.btn_save.setEnabled(editable and not busy)
         self.btn_cancel.setEnabled(editable)
 
         # New always allowed, Delete only when there is selection
         self.btn_new.setEnabled(True)
-        self.btn_delete.setEnabled(self._current_item() is not None)
+        self.btn_delete.setEnabled(self._current_item() is not None and not busy)
 
         # When idle and nothing selected, clear editors
         if self._state == EditorState.IDLE and self._current_tag is None:
-            self.name_edit.clear()
-            self.desc_edit.clear()
+            self._load_tag_into_editors(None)
 
         # Update mode label text
         if self._state == EditorState.CREATING:
@@ -194,14 +225,43 @@ class TagEditorWindow(QMainWindow):
 
     # --- Data binding ---------------------------------------------
     def _populate_list(self) -> None:
-        self.list_widget.clear()
-        for tag in global_tags:
+        # One repaint and no per-item signals for the whole fill.
+        self.list_widget.setUpdatesEnabled(False)
+        self.list_widget.blockSignals(True)
+        try:
+            self.list_widget.clear()
+            for tag in global_tags:
+                item = QListWidgetItem(tag.name)
+                item.setData(Qt.ItemDataRole.UserRole, tag)
+                self.list_widget.addItem(item)
+        finally:
+            self.list_widget.blockSignals(False)
+            self.list_widget.setUpdatesEnabled(True)
+
+    def _upsert_item(self, tag: Tag, old_name: Optional[str] = None) -> QListWidgetItem:
+        """Bind the list row for ``tag`` to it, adding a row if there is none.
+
+        ``old_name`` is the name the row is currently listed under, when the
+        tag was renamed. Single changes go through here rather than a full
+        `_populate_list`, so scroll position and selection are kept.
+        """
+        matches = self.list_widget.findItems(old_name or tag.name, Qt.MatchFlag.MatchExactly)
+        if matches:
+            item = matches[0]
+            item.setText(tag.name)
+        else:
             item = QListWidgetItem(tag.name)
-            item.setData(Qt.ItemDataRole.UserRole, tag)
             self.list_widget.addItem(item)
+        item.setData(Qt.ItemDataRole.UserRole, tag)
+        return item
 
     def _load_tag_into_editors(self, tag: Optional[Tag]) -> None:
         self._current_tag = tag
+        # Reselecting the tag already shown (list rebuilds, keyboard
+        # navigation) would otherwise re-lay out the description.
+        if tag is not None and tag is self._loaded_tag:
+            return
+        self._loaded_tag = tag
         if tag is None:
             self.name_edit.clear()
             self.desc_edit.clear()
@@ -215,6 +275,38 @@ class TagEditorWindow(QMainWindow):
         items = self.list_widget.selectedItems()
         return items[0] if items else None
 
+    def _flush_logs(self, logs: list[Log]) -> None:
+        """Save ``logs`` after a tag rename/delete touched them.
+
+        Every log is serialized here, on the GUI thread, and the files are
+        then written in one job on the save worker.
+        """
+        payloads: list[tuple[Log, str]] = []
+        for log in logs:
+            try:
+                payloads.append((log, log.serialize_for_save()))
+            except Exception:
+                # If a log fails to serialize, continue with others
+                continue
+        if not payloads:
+            return
+
+        self._flushes_in_flight += 1
+        future = save_executor.submit(_write_logs, payloads)
+
+        def done(f: Future) -> None:
+            try:
+                self.logs_flushed.emit()
+            except RuntimeError:
+                # The window was destroyed before the writes finished.
+                pass
+
+        future.add_done_callback(done)
+
+    def _on_logs_flushed(self) -> None:
+        self._flushes_in_flight -= 1
+        self._apply_state()
+
     # --- Slots ----------------------------------------------------
     def _on_selection_changed(self) -> None:
         # Only react to selection when not in the middle of an edit
@@ -243,8 +335,7 @@ class TagEditorWindow(QMainWindow):
     def _begin_create(self) -> None:
         self.list_widget.clearSelection()
         self._current_tag = None
-        self.name_edit.clear()
-        self.desc_edit.clear()
+        self._load_tag_into_editors(None)
         self._set_state(EditorState.CREATING)
         self.name_edit.setFocus()
 
@@ -256,8 +347,7 @@ class TagEditorWindow(QMainWindow):
             self._load_tag_into_editors(self._current_tag)
         else:
             self._current_tag = None
-            self.name_edit.clear()
-            self.desc_edit.clear()
+            self._load_tag_into_editors(None)
         self._set_state(EditorState.IDLE)
 
     def _save_current(self) -> None:
@@ -270,15 +360,14 @@ class TagEditorWindow(QMainWindow):
             return
 
         # Prevent duplicate names
-        for existing in global_tags:
+        existing = global_tags_by_name.get(name)
+        if existing is not None:
             if self._state == EditorState.CREATING:
-                if existing.name == name:
-                    QMessageBox.warning(self, "Warning", "A tag with this name already exists.")
-                    return
-            else:  # editing
-                if existing is not self._current_tag and existing.name == name:
-                    QMessageBox.warning(self, "Warning", "Another tag with this name already exists.")
-                    return
+                QMessageBox.warning(self, "Warning", "A tag with this name already exists.")
+                return
+            elif existing is not self._current_tag:  # editing
+                QMessageBox.warning(self, "Warning", "Another tag with this name already exists.")
+                return
 
         desc = self.desc_edit.toPlainText().strip()
 
@@ -290,9 +379,8 @@ class TagEditorWindow(QMainWindow):
                 return
 
             global_tags.append(new_tag)
-            item = QListWidgetItem(new_tag.name)
-            item.setData(Qt.ItemDataRole.UserRole, new_tag)
-            self.list_widget.addItem(item)
+            global_tags_by_name[new_tag.name] = new_tag
+            item = self._upsert_item(new_tag)
             self.list_widget.setCurrentItem(item)
             self._current_tag = new_tag
 
@@ -316,47 +404,43 @@ class TagEditorWindow(QMainWindow):
 
             # Persist updated tag and propagate changes to logs
             try:
-                from DataClasses.tag import TAGS_FOLDER
-                import os
-
                 if old_tag.name != updated.name:
-                    old_path = os.path.join(TAGS_FOLDER, f"{old_tag.name}.json")
-                    if os.path.exists(old_path):
-                        os.remove(old_path)
+                    remove_if_exists(os.path.join(TAGS_FOLDER, f"{old_tag.name}.json"))
                 updated.save()
             except Exception as exc:
                 QMessageBox.critical(self, "Error", f"Failed to save tag:\n{exc}")
                 return
 
-            # Replace in global tag list
-            idx = global_tags.index(old_tag)
+            # Replace in global tag list. The list widget is filled from
+            # it in order, so the selected row is normally its index.
+            item = self._current_item()
+            idx = self.list_widget.row(item) if item is not None else -1
+            if not (0 <= idx < len(global_tags) and global_tags[idx] is old_tag):
+                idx = global_tags.index(old_tag)
             global_tags[idx] = updated
+            if global_tags_by_name.get(old_tag.name) is old_tag:
+                del global_tags_by_name[old_tag.name]
+            global_tags_by_name[updated.name] = updated
             self._current_tag = updated
 
             # Update any logs that reference this tag (by name)
-            from DataClasses.tag import Tag as TagClass
+            dirty: list[Log] = []
             for log in global_logs:
                 changed = False
-                new_tags: list[TagClass] = []
+                new_tags: list[Tag] = []
                 for t in log.tags:
-                    if isinstance(t, TagClass) and t.name == old_tag.name:
+                    if isinstance(t, Tag) and t.name == old_tag.name:
                         new_tags.append(updated)
                         changed = True
                     else:
                         new_tags.append(t)
                 if changed:
                     log.tags = new_tags
-                    try:
-                        log.save()  
-                    except Exception:
-                        # If a log fails to save, continue with others
-                        continue
+                    dirty.append(log)
+            self._flush_logs(dirty)
 
             # Refresh list item text/binding
-            item = self._current_item()
-            if item is not None:    
-                item.setText(updated.name)
-                item.setData(Qt.ItemDataRole.UserRole, updated)
+            self._upsert_item(updated, old_name=old_tag.name)
 
         self._set_state(EditorState.IDLE)
 
@@ -381,26 +465,21 @@ class TagEditorWindow(QMainWindow):
             global_tags.remove(tag)
         except ValueError:
             pass
+        if global_tags_by_name.get(tag.name) is tag:
+            del global_tags_by_name[tag.name]
 
         # Remove this tag from all logs and resave them
-        from DataClasses.tag import Tag as TagClass
+        dirty: list[Log] = []
         for log in global_logs:
             original_count = len(log.tags)
-            log.tags = [t for t in log.tags if not (isinstance(t, TagClass) and t.name == tag.name)]
+            log.tags = [t for t in log.tags if not (isinstance(t, Tag) and t.name == tag.name)]
             if len(log.tags) != original_count:
-                try:
-                    log.save()
-                except Exception:
-                    continue
+                dirty.append(log)
+        self._flush_logs(dirty)
 
         # Remove persisted JSON file, if it exists
         try:
-            from DataClasses.tag import TAGS_FOLDER
-            import os
-
-            filepath = os.path.join(TAGS_FOLDER, f"{tag.name}.json")
-            if os.path.exists(filepath):
-                os.remove(filepath)
+            remove_if_exists(os.path.join(TAGS_FOLDER, f"{tag.name}.json"))
         except Exception:
             # Silently ignore file deletion issues
             pass
@@ -421,8 +500,7 @@ class TagEditorWindow(QMainWindow):
                 self._current_tag = None
         else:
             self._current_tag = None
-            self.name_edit.clear()
-            self.desc_edit.clear()
+            self._load_tag_into_editors(None)
 
         self._set_state(EditorState.IDLE)
 
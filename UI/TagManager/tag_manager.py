@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Callable, Iterable
 
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (
@@ -17,6 +17,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtGui import QKeySequence, QShortcut
 from DataClasses.tag import Tag, tags as global_tags
 from DataClasses.log import Log
+from UI.TagManager import state as tag_manager_state
 
 
 class TagManagerWindow(QDialog):
@@ -26,14 +27,17 @@ class TagManagerWindow(QDialog):
     which of the already-defined tags are attached to the given log.
     """
 
-    def __init__(self, log: Log, parent=None) -> None:
+    def __init__(self, log: Log, parent=None, on_change: Callable[[], None] | None = None) -> None:
         super().__init__(parent)
         self._log = log
+        # Called after each toggle changes the log's tags, so the owner
+        # (the log editor) knows the log needs saving.
+        self._on_change = on_change
+        # Names of the tags attached to the log, kept in step with toggles.
+        self._attached = {t.name for t in log.tags}
 
         # Register this instance in module-level state so other
         # UI components can prevent multiple windows.
-        from UI.TagManager import state as tag_manager_state
-
         tag_manager_state.active_tag_manager = self
 
         self.setWindowTitle("NBJournal - Tag Manager")
@@ -68,17 +72,24 @@ class TagManagerWindow(QDialog):
         QShortcut(QKeySequence("Ctrl+W"), self, activated=self.close)
 
     def _load_tags_into_list(self, tags: Iterable[Tag]) -> None:
-        self.list_widget.clear()
-        attached_names = {t.name for t in self._log.tags}
-        for tag in tags:
-            item = QListWidgetItem(tag.name)
-            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-            if tag.name in attached_names:
-                item.setCheckState(Qt.CheckState.Checked)
-            else:
-                item.setCheckState(Qt.CheckState.Unchecked)
-            item.setData(Qt.ItemDataRole.UserRole, tag)
-            self.list_widget.addItem(item)
+        # One repaint for the whole fill, and no itemChanged per check
+        # state set here.
+        self.list_widget.setUpdatesEnabled(False)
+        self.list_widget.blockSignals(True)
+        try:
+            self.list_widget.clear()
+            for tag in tags:
+                item = QListWidgetItem(tag.name)
+                item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+                if tag.name in self._attached:
+                    item.setCheckState(Qt.CheckState.Checked)
+                else:
+                    item.setCheckState(Qt.CheckState.Unchecked)
+                item.setData(Qt.ItemDataRole.UserRole, tag)
+                self.list_widget.addItem(item)
+        finally:
+            self.list_widget.blockSignals(False)
+            self.list_widget.setUpdatesEnabled(True)
 
     def _on_item_changed(self, item: QListWidgetItem) -> None:
         """Update the log's tag list when a checkbox is toggled."""
@@ -88,15 +99,22 @@ class TagManagerWindow(QDialog):
 
         if item.checkState() == Qt.CheckState.Checked:
             # Attach if not already present
-            if all(existing.name != tag.name for existing in self._log.tags):
-                self._log.tags.append(tag)
-        else:
-            # Detach
+            if tag.name in self._attached:
+                return
+            self._attached.add(tag.name)
+            self._log.tags.append(tag)
+        elif tag.name in self._attached:
+            # Detach every entry with this name; older logs may list a tag
+            # more than once.
+            self._attached.discard(tag.name)
             self._log.tags = [t for t in self._log.tags if t.name != tag.name]
+        else:
+            return
 
-    def closeEvent(self, event):  # type: ignore[override]
-        from UI.TagManager import state as tag_manager_state
+        if self._on_change is not None:
+            self._on_change()
 
+    def closeEvent(self, event):  # type: ignore[override]
         tag_manager_state.active_tag_manager = None
         super().closeEvent(event)
 
@@ -108,7 +126,5 @@ class TagManagerWindow(QDialog):
         module-level `active_tag_manager` is reset even if closeEvent isn't
         directly invoked.
         """
-        from UI.TagManager import state as tag_manager_state
-
         tag_manager_state.active_tag_manager = None
         return super().reject()
@@ -17,30 +17,40 @@ def main():
     # Use Fusion style (works well with custom palettes)
     app.setStyle("Fusion")
 
+    # Palette role -> ColorPalette field holding its color.
+    palette_roles = (
+        (QPalette.ColorRole.Window, "window"),
+        (QPalette.ColorRole.WindowText, "window_text"),
+        (QPalette.ColorRole.Base, "base"),
+        (QPalette.ColorRole.AlternateBase, "alternate_base"),
+        (QPalette.ColorRole.ToolTipBase, "tooltip_base"),
+        (QPalette.ColorRole.ToolTipText, "tooltip_text"),
+        (QPalette.ColorRole.Text, "text"),
+        (QPalette.ColorRole.Button, "button"),
+        (QPalette.ColorRole.ButtonText, "button_text"),
+        (QPalette.ColorRole.BrightText, "bright_text"),
+        (QPalette.ColorRole.Highlight, "highlight"),
+        (QPalette.ColorRole.HighlightedText, "highlighted_text"),
+        (QPalette.ColorRole.Link, "link"),
+    )
+    # Colors last applied, so saves that didn't touch the palette skip it.
+    applied_colors: tuple[str, ...] | None = None
+
     def apply_palette_from_settings(current_settings: settings.Settings) -> None:
         """Apply the color palette from settings to the QApplication."""
+        nonlocal applied_colors
 
         palette_data = current_settings.color_palette
-
-        def c(hex_color: str) -> QColor:
-            return QColor(hex_color)
+        colors = tuple(getattr(palette_data, attr) for _, attr in palette_roles)
+        if colors == applied_colors:
+            return
 
         qt_palette = QPalette()
-        qt_palette.setColor(QPalette.ColorRole.Window, c(palette_data.window))
-        qt_palette.setColor(QPalette.ColorRole.WindowText, c(palette_data.window_text))
-        qt_palette.setColor(QPalette.ColorRole.Base, c(palette_data.base))
-        qt_palette.setColor(QPalette.ColorRole.AlternateBase, c(palette_data.alternate_base))
-        qt_palette.setColor(QPalette.ColorRole.ToolTipBase, c(palette_data.tooltip_base))
-        qt_palette.setColor(QPalette.ColorRole.ToolTipText, c(palette_data.tooltip_text))
-        qt_palette.setColor(QPalette.ColorRole.Text, c(palette_data.text))
-        qt_palette.setColor(QPalette.ColorRole.Button, c(palette_data.button))
-        qt_palette.setColor(QPalette.ColorRole.ButtonText, c(palette_data.button_text))
-        qt_palette.setColor(QPalette.ColorRole.BrightText, c(palette_data.bright_text))
-        qt_palette.setColor(QPalette.ColorRole.Highlight, c(palette_data.highlight))
-        qt_palette.setColor(QPalette.ColorRole.HighlightedText, c(palette_data.highlighted_text))
-        qt_palette.setColor(QPalette.ColorRole.Link, c(palette_data.link))
+        for (role, _), hex_color in zip(palette_roles, colors):
+            qt_palette.setColor(role, QColor(hex_color))
 
         app.setPalette(qt_palette)
+        applied_colors = colors
 
     # Apply initial palette from loaded settings
     apply_palette_from_settings(settings.user_settings)